@@ -6,6 +6,13 @@ All endpoints follow RESTful conventions.
 """
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+try:
+    import orjson  # noqa: F401 - used by ORJSONResponse
+    _HAS_ORJSON = True
+except ImportError:  # Optional: responses fall back to stdlib json without it
+    _HAS_ORJSON = False
 
 from .sessions import router as sessions_router
 from .jobs import router as jobs_router
@@ -21,8 +28,13 @@ from .effects import router as effects_router
 from .filebrowser import router as filebrowser_router
 from .footwork import router as footwork_router
 
-# Main API router
-api_router = APIRouter(prefix="/api")
+# Main API router. Included routers inherit the response class, so every
+# JSON route renders through orjson when it's available (peaks/moments
+# payloads are large float lists).
+api_router = APIRouter(
+    prefix="/api",
+    default_response_class=ORJSONResponse if _HAS_ORJSON else JSONResponse,
+)
 
 # Health check endpoint
 @api_router.get("/health")
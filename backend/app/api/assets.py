@@ -5,6 +5,9 @@ Download and manage audio files.
 """
 
 from pathlib import Path
+import asyncio
+import hashlib
+import os
 import subprocess
 import zipfile
 import tempfile
@@ -16,6 +19,7 @@ from fastapi.responses import FileResponse
 from ..core.database import get_db
 from ..core.models import Asset, Session
 from ..core.storage import get_storage
+from ..core.responses import RangedFileResponse
 
 router = APIRouter(prefix="/assets", tags=["Assets"])
 
@@ -65,7 +69,7 @@ async def download_asset(asset_id: str):
         if not file_path.exists():
             raise HTTPException(404, "File not found on disk")
         
-        return FileResponse(
+        return RangedFileResponse(
             file_path,
             media_type="audio/wav",
             filename=asset.filename,
@@ -114,7 +118,7 @@ async def download_stem(session_id: str, stem_name: str):
         sess = session.query(Session).filter(Session.id == session_id).first()
         original_name = sess.source_filename.rsplit(".", 1)[0] if sess and sess.source_filename else "audio"
     
-    return FileResponse(
+    return RangedFileResponse(
         file_path,
         media_type="audio/wav",
         filename=f"{original_name}_{stem_name}.wav",
@@ -137,12 +141,39 @@ async def download_all_stems(session_id: str):
         sess = session.query(Session).filter(Session.id == session_id).first()
         original_name = sess.source_filename.rsplit(".", 1)[0] if sess and sess.source_filename else "audio"
     
-    # Create ZIP in temp location
-    zip_path = storage.get_cache_path(f"{session_id}_stems", ".zip")
+    def create_zip() -> Path:
+        # Name the cached ZIP after the exact stem set (archive name, path,
+        # size, mtime), so adding, removing, renaming or rewriting any stem
+        # builds a new archive and repeat downloads reuse the current one
+        fingerprint = hashlib.sha256()
+        for stem_name, stem_path in sorted(stems.items()):
+            st = stem_path.stat()
+            fingerprint.update(
+                f"{original_name}_{stem_name}.wav\0{stem_path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode()
+            )
+        zip_path = storage.get_cache_path(
+            f"{session_id}_stems_{fingerprint.hexdigest()[:16]}", ".zip"
+        )
+        if zip_path.exists():
+            return zip_path
+        # Build under a unique name and swap in atomically, so concurrent
+        # downloads never serve (or clobber) a half-written archive
+        fd, tmp_name = tempfile.mkstemp(suffix=".zip.tmp", dir=zip_path.parent)
+        os.close(fd)
+        try:
+            # PCM barely deflates; level 1 gets the same ratio for less CPU than the default 6
+            with zipfile.ZipFile(tmp_name, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+                for stem_name, stem_path in stems.items():
+                    zf.write(stem_path, f"{original_name}_{stem_name}.wav")
+            os.replace(tmp_name, zip_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return zip_path
     
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for stem_name, stem_path in stems.items():
-            zf.write(stem_path, f"{original_name}_{stem_name}.wav")
+    # Compressing several full-length WAVs takes seconds; keep it off the event loop
+    loop = asyncio.get_running_loop()
+    zip_path = await loop.run_in_executor(None, create_zip)
     
     return FileResponse(
         zip_path,
@@ -10,9 +10,10 @@ from typing import Optional, List
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
+from ..core.responses import RangedFileResponse
+
 router = APIRouter(prefix="/filebrowser", tags=["File Browser"])
 
 # Audio file extensions we support
@@ -250,7 +251,7 @@ async def stream_audio_file(path: str = Query(..., description="File path to str
         '.opus': 'audio/opus',
     }
     
-    return FileResponse(
+    return RangedFileResponse(
         file_path,
         media_type=mime_types.get(ext, 'audio/wav'),
         filename=file_path.name,
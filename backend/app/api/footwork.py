@@ -15,7 +15,7 @@ import base64
 
 from ..engines.footwork_drum_engine import FootworkDrumEngine
 from ..engines.trigger_engine import (
-    TriggerEngine, TriggerMode, TRIGGER_PRESETS,
+    TriggerEngine, TriggerMode, TRIGGER_PRESETS, create_trigger_engine,
     PolyrhythmicTriggerSource, JukePatternTriggerSource,
     OffbeatTriggerSource, MicroTimingTriggerSource,
     TriggerSource,
@@ -139,12 +139,7 @@ async def generate_pattern(
         
         # Use preset if provided
         if preset and preset in TRIGGER_PRESETS:
-            config = TRIGGER_PRESETS[preset]
-            engine = TriggerEngine(
-                mode=config['mode'],
-                trigger_source=config['trigger_source'],
-                rules=config.get('rules', []),
-            )
+            engine = create_trigger_engine(preset)
         elif pattern_config:
             # Build custom pattern from config
             source_type = pattern_config.get('type', 'polyrhythmic')
@@ -199,12 +194,7 @@ async def generate_pattern(
             )
         else:
             # Default to footwork_basic
-            config = TRIGGER_PRESETS['footwork_basic']
-            engine = TriggerEngine(
-                mode=config['mode'],
-                trigger_source=config['trigger_source'],
-                rules=config.get('rules', []),
-            )
+            engine = create_trigger_engine('footwork_basic')
         
         # Generate sequence
         events = engine.generate_sequence(
@@ -241,7 +231,7 @@ async def list_presets() -> dict:
     footwork_presets = {
         name: {
             "mode": config['mode'].value,
-            "trigger_source_type": config['trigger_source'].__class__.__name__,
+            "trigger_source_type": config['trigger_source_class'].__name__,
         }
         for name, config in TRIGGER_PRESETS.items()
         if name.startswith('footwork') or name in ['juke_pattern', 'ghetto_house']
@@ -214,6 +214,7 @@ async def upload_and_process(
             session_id=session_id,
             job_type=JobType.ANALYSIS,
             input_path=str(file_path),
+            config={"content_hash": content_hash},
         )
         jobs.append({"id": analysis_job.id, "type": "analysis"})
 
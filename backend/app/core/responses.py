@@ -0,0 +1,154 @@
+"""
+HTTP Responses
+
+File responses that honour single byte-range requests, so browsers can
+start playback and seek in large audio files without downloading them
+first. (Starlette only gained this itself in 0.39; we're pinned below.)
+"""
+
+import os
+import re
+import stat
+from typing import Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range Range header into an inclusive (start, end).
+
+    Returns None when the header should be ignored (malformed or
+    multi-range) and the full file served instead.
+
+    Raises:
+        ValueError: The range is valid but unsatisfiable for `size`.
+    """
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+
+    if not first:
+        # Suffix range: the final N bytes
+        if not last:
+            return None
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError(header)
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError(header)
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+class RangedFileResponse(FileResponse):
+    """FileResponse that answers `Range: bytes=...` with 206 Partial Content."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.headers["accept-ranges"] = "bytes"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request_headers = Headers(scope=scope)
+        range_header = request_headers.get("range")
+        if range_header is None or self.status_code != 200:
+            await super().__call__(scope, receive, send)
+            return
+
+        if self.stat_result is None:
+            try:
+                stat_result = await anyio.to_thread.run_sync(os.stat, self.path)
+            except FileNotFoundError:
+                raise RuntimeError(f"File at path {self.path} does not exist.")
+            if not stat.S_ISREG(stat_result.st_mode):
+                raise RuntimeError(f"File at path {self.path} is not a file.")
+            self.stat_result = stat_result
+            self.set_stat_headers(stat_result)
+        size = self.stat_result.st_size
+
+        # If-Range: only honour the range if the client's copy is current
+        if_range = request_headers.get("if-range")
+        if if_range is not None and if_range not in (
+            self.headers.get("etag"), self.headers.get("last-modified")
+        ):
+            await super().__call__(scope, receive, send)
+            return
+
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            response = Response(
+                status_code=416, headers={"content-range": f"bytes */{size}"}
+            )
+            await response(scope, receive, send)
+            return
+        if byte_range is None:
+            await super().__call__(scope, receive, send)
+            return
+
+        start, end = byte_range
+        remaining = end - start + 1
+        self.status_code = 206
+        self.headers["content-length"] = str(remaining)
+        self.headers["content-range"] = f"bytes {start}-{end}/{size}"
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        if self.send_header_only:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        else:
+            async with await anyio.open_file(self.path, mode="rb") as file:
+                await file.seek(start)
+                while remaining > 0:
+                    chunk = await file.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    await send(
+                        {
+                            "type": "http.response.body",
+                            "body": chunk,
+                            "more_body": remaining > 0,
+                        }
+                    )
+                if remaining > 0:
+                    # File shrank underneath us; close the body cleanly
+                    await send({"type": "http.response.body", "body": b"", "more_body": False})
+        if self.background is not None:
+            await self.background()
+
+
+class RangedStaticFiles(StaticFiles):
+    """StaticFiles mount that serves files through RangedFileResponse."""
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        response = RangedFileResponse(
+            full_path, status_code=status_code, stat_result=stat_result, method=scope["method"]
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -7,6 +7,9 @@ These are the actual work units that run in background threads.
 
 from pathlib import Path
 from typing import Dict, Any, Callable, Optional
+import json
+import os
+import tempfile
 import traceback
 
 from .models import JobType, StemRole, Asset
@@ -136,20 +139,81 @@ def process_separation(job, progress: Callable[[float, str], None]) -> Dict[str,
     return output_paths
 
 
+# Bump when process_analysis output changes so stale cache entries are ignored
+ANALYSIS_CACHE_VERSION = 1
+
+
 @Worker(JobType.ANALYSIS)
 def process_analysis(job, progress: Callable[[float, str], None]) -> Dict[str, Any]:
     """
     Analyze audio for BPM and key.
     
     Input: job.input_path = path to audio file
+    Config: job.config = {"content_hash": "<sha256 of the upload>"} (optional)
     Output: {"bpm": 120.5, "key": "Am", "duration": 180.5}
-    """
-    import librosa
     
+    Results are cached by content hash, so re-uploading the same file
+    skips the analysis entirely.
+    """
     input_path = Path(job.input_path)
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
     
+    storage = get_storage()
+    config = job.config or {}
+    content_hash = config.get("content_hash") or storage.compute_hash(input_path)
+    cache_path = storage.get_cache_path(
+        f"{content_hash}_analysis_v{ANALYSIS_CACHE_VERSION}", ".json"
+    )
+    
+    result = None
+    if cache_path.exists():
+        try:
+            result = json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            result = None
+    
+    if result is None:
+        result = _analyze_bpm_key(input_path, progress)
+        # Failed detections come back as bpm=None / key="Unknown"; don't pin
+        # a possibly transient failure to this content hash
+        if result["bpm"] is not None and result["key"] != "Unknown":
+            _write_cache_atomic(cache_path, json.dumps(result))
+    
+    progress(100, "Analysis complete")
+    
+    # Update session with analysis results
+    db = get_db()
+    with db.session() as session:
+        from .models import Session
+        sess = session.query(Session).filter(Session.id == job.session_id).first()
+        if sess:
+            sess.bpm = result["bpm"]
+            sess.key = result["key"]
+            sess.duration_seconds = result["duration"]
+            session.commit()
+    
+    return result
+
+
+def _write_cache_atomic(cache_path: Path, text: str) -> None:
+    """Write a cache entry via temp file + rename so readers never see a partial file."""
+    tmp_name = None
+    try:
+        fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=cache_path.parent)
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        # Caching is best-effort
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+def _analyze_bpm_key(input_path: Path, progress: Callable[[float, str], None]) -> Dict[str, Any]:
+    """Run the BPM/key/duration analysis behind process_analysis."""
+    import librosa
+    
     progress(10, "Loading audio...")
     # Avoid loading full files into memory for analysis.
     # A short excerpt is enough for stable tempo/key estimation and prevents stalls.
@@ -181,19 +245,6 @@ def process_analysis(job, progress: Callable[[float, str], None]) -> Dict[str, A
     except Exception:
         key = "Unknown"
     
-    progress(100, "Analysis complete")
-    
-    # Update session with analysis results
-    db = get_db()
-    with db.session() as session:
-        from .models import Session
-        sess = session.query(Session).filter(Session.id == job.session_id).first()
-        if sess:
-            sess.bpm = bpm
-            sess.key = key
-            sess.duration_seconds = duration
-            session.commit()
-    
     return {
         "bpm": bpm,
         "key": key,
@@ -630,18 +630,9 @@ class ArtifactEngine:
         resampled = librosa.resample(audio, orig_sr=sr, target_sr=new_sr)
         
         # Pitch shift back (keeps formant change, restores pitch)
-        # Use GPU acceleration if available
         try:
-            from app.engines.torch_utils import pitch_shift, get_device
-            import torch
-            
-            device = get_device()
-            resampled_tensor = torch.from_numpy(resampled).float().to(device)
-            if resampled_tensor.ndim == 1: resampled_tensor = resampled_tensor.unsqueeze(0)
-            
-            shifted_tensor = pitch_shift(resampled_tensor, new_sr, -semitones)
-            formant_shifted = shifted_tensor.cpu().numpy()
-            if formant_shifted.ndim == 2: formant_shifted = formant_shifted[0]
+            from app.engines.torch_utils import pitch_shift_array
+            formant_shifted = pitch_shift_array(resampled, new_sr, -semitones)
         except:
              # CPU fallback
              formant_shifted = librosa.effects.pitch_shift(resampled, sr=new_sr, n_steps=-semitones)
@@ -775,19 +766,11 @@ class ArtifactEngine:
         avg_wobble = np.mean(lfo)
         
         if abs(avg_wobble) > 0.01:
-            # Use GPU acceleration
-            from app.engines.torch_utils import pitch_shift
-            import torch
-            from app.engines.torch_utils import get_device
+            # Pedalboard works on host arrays; no device round trip
+            from app.engines.torch_utils import pitch_shift, pitch_shift_array
             
             if isinstance(audio, np.ndarray):
-                device = get_device()
-                audio_tensor = torch.from_numpy(audio).float().to(device)
-                if audio_tensor.ndim == 1: audio_tensor = audio_tensor.unsqueeze(0)
-                
-                shifted_tensor = pitch_shift(audio_tensor, sr, avg_wobble)
-                wobbled = shifted_tensor.cpu().numpy()
-                if wobbled.ndim == 2: wobbled = wobbled[0]
+                wobbled = pitch_shift_array(audio, sr, avg_wobble)
             else:
                 wobbled = pitch_shift(audio, sr, avg_wobble)
         else:
@@ -114,14 +114,9 @@ class EmbeddingEngine:
         try:
             # Load audio segment
             target_sr = 48000  # CLAP expects 48kHz
-            waveform = load_audio(audio_path, sr=target_sr)
-            audio_np = waveform.cpu().numpy()
-            
-            # Mix to mono if needed
-            if audio_np.ndim > 1 and audio_np.shape[0] > 1:
-                audio_np = audio_np.mean(axis=0)
-            elif audio_np.ndim > 1:
-                audio_np = audio_np[0]
+            # Mixed to mono on-device, so only one channel comes back to host
+            waveform = load_audio(audio_path, sr=target_sr, mono=True)
+            audio_np = waveform.cpu().numpy()[0]
             
             # Extract segment
             start_sample = int(start_time * target_sr)
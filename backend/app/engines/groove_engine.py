@@ -16,6 +16,94 @@ import scipy.interpolate
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
+try:
+    from numba import njit, float32, float64, int64
+    _HAS_NUMBA = True
+except ImportError:  # Optional: onset_method='fast' falls back to librosa without it
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+    # Explicit signature: compiled (or loaded from the on-disk cache) at import,
+    # so the first extract_groove() call doesn't pay for type inference
+    @njit(
+        int64[:](float32[::1], int64, int64, int64, int64, int64, float64, int64),
+        cache=True,
+        fastmath=True
+    )
+    def _onset_frames_td(
+        audio: np.ndarray,
+        hop: int,
+        pre_max: int,
+        post_max: int,
+        pre_avg: int,
+        post_avg: int,
+        delta: float,
+        wait: int
+    ) -> np.ndarray:
+        """
+        Time-domain onset picker: rectified RMS flux + adaptive threshold.
+        
+        Same peak rule as librosa.util.peak_pick (local max that clears the
+        local mean by delta, at least `wait` frames apart), then backtracked
+        to the first frame of the energy rise like onset_detect(backtrack=True).
+        """
+        n_frames = audio.shape[0] // hop
+        env = np.zeros(n_frames)
+        for f in range(n_frames):
+            acc = 0.0
+            for k in range(f * hop, (f + 1) * hop):
+                acc += audio[k] * audio[k]
+            env[f] = np.sqrt(acc / hop)
+        
+        # Silence before the first frame, so a hit at t=0 still registers
+        flux = np.zeros(n_frames)
+        peak = 0.0
+        prev = 0.0
+        for f in range(n_frames):
+            d = env[f] - prev
+            prev = env[f]
+            if d > 0.0:
+                flux[f] = d
+                if d > peak:
+                    peak = d
+        if peak == 0.0:
+            return np.zeros(0, dtype=np.int64)
+        for f in range(n_frames):
+            flux[f] /= peak
+        
+        onsets = np.zeros(n_frames, dtype=np.int64)
+        count = 0
+        last = -wait - 1
+        for f in range(n_frames):
+            v = flux[f]
+            if v == 0.0 or f - last <= wait:
+                continue
+            is_max = True
+            for k in range(max(0, f - pre_max), min(n_frames, f + post_max + 1)):
+                if flux[k] > v:
+                    is_max = False
+                    break
+            if not is_max:
+                continue
+            lo = max(0, f - pre_avg)
+            hi = min(n_frames, f + post_avg + 1)
+            mean = 0.0
+            for k in range(lo, hi):
+                mean += flux[k]
+            if v < mean / (hi - lo) + delta:
+                continue
+            
+            # Backtrack to the first frame of the energy rise
+            b = f
+            while b > 0 and flux[b - 1] > 0.0:
+                b -= 1
+            onsets[count] = b
+            count += 1
+            last = f
+        
+        return onsets[:count]
+
 
 @dataclass
 class GrooveTemplate:
@@ -31,11 +119,15 @@ class GrooveTemplate:
     @property
     def swing_amount(self) -> float:
         """Average absolute deviation from grid."""
+        if self.offsets.size == 0:
+            return 0.0
         return float(np.mean(np.abs(self.offsets)))
     
     @property
     def groove_type(self) -> str:
         """Classify groove type."""
+        if self.offsets.size == 0:
+            return "straight"
         mean_offset = np.mean(self.offsets * 1000)  # ms
         if abs(mean_offset) < 5:
             return "straight"
@@ -47,6 +139,8 @@ class GrooveTemplate:
     @property
     def tightness(self) -> float:
         """How consistent is the timing? (0-1, higher = tighter)"""
+        if self.offsets.size == 0:
+            return 0.0
         std = np.std(self.offsets * 1000)  # ms
         # Normalize: 0ms std = 1.0 (perfect), 50ms std = 0.0 (loose)
         return float(np.clip(1.0 - (std / 50.0), 0, 1))
@@ -60,8 +154,42 @@ class GrooveEngine:
     feel like it was played by J Dilla.
     """
     
-    def __init__(self, sr: int = 44100):
+    def __init__(self, sr: int = 44100, onset_method: str = "spectral"):
+        """
+        Args:
+            sr: Sample rate
+            onset_method: 'spectral' (librosa onset_strength + onset_detect) or
+                'fast' (JIT time-domain energy flux, no STFT; for clearly
+                transient material like drums). 'fast' needs numba.
+        """
         self.sr = sr
+        self.onset_method = onset_method
+    
+    def _detect_onsets(self, audio: np.ndarray, aggregate=None) -> np.ndarray:
+        """Onset times in seconds, backtracked to the start of each transient."""
+        if self.onset_method == "fast" and _HAS_NUMBA:
+            # Same hop and peak-pick windows as librosa's onset_detect defaults
+            hop = 512
+            frames = _onset_frames_td(
+                np.ascontiguousarray(audio, dtype=np.float32),
+                hop,
+                int(0.03 * self.sr // hop),
+                0,
+                int(0.10 * self.sr // hop),
+                int(0.10 * self.sr // hop) + 1,
+                0.07,
+                int(0.03 * self.sr // hop)
+            )
+            return frames * hop / self.sr
+        
+        kwargs = {'aggregate': aggregate} if aggregate is not None else {}
+        onset_env = librosa.onset.onset_strength(y=audio, sr=self.sr, **kwargs)
+        return librosa.onset.onset_detect(
+            onset_envelope=onset_env,
+            sr=self.sr,
+            units='time',
+            backtrack=True  # More accurate onset times
+        )
     
     def extract_groove(
         self,
@@ -96,30 +224,11 @@ class GrooveEngine:
         subdivision_duration = beat_duration / subdivision_factor
         
         # Detect onsets
-        onset_env = librosa.onset.onset_strength(
-            y=audio, 
-            sr=self.sr,
-            aggregate=np.median
-        )
-        
-        onsets = librosa.onset.onset_detect(
-            onset_envelope=onset_env,
-            sr=self.sr,
-            units='time',
-            backtrack=True  # More accurate onset times
-        )
-        
-        # Calculate grid positions and offsets
-        grid_positions = np.zeros_like(onsets)
-        offsets = np.zeros_like(onsets)
+        onsets = self._detect_onsets(audio, aggregate=np.median)
         
-        for i, onset_time in enumerate(onsets):
-            # Find nearest grid point
-            grid_idx = np.round(onset_time / subdivision_duration)
-            grid_pos = grid_idx * subdivision_duration
-            
-            grid_positions[i] = grid_pos
-            offsets[i] = onset_time - grid_pos
+        # Snap every onset to its nearest grid point in one pass
+        grid_positions = np.round(onsets / subdivision_duration) * subdivision_duration
+        offsets = onsets - grid_positions
         
         return GrooveTemplate(
             bpm=bpm,
@@ -152,76 +261,64 @@ class GrooveEngine:
             audio = librosa.to_mono(audio)
         
         # Detect onsets in target
-        onset_env = librosa.onset.onset_strength(y=audio, sr=self.sr)
-        target_onsets = librosa.onset.onset_detect(
-            onset_envelope=onset_env,
-            sr=self.sr,
-            units='time',
-            backtrack=True
-        )
+        target_onsets = self._detect_onsets(audio)
         
         if len(target_onsets) == 0:
             return audio  # No onsets to groove
         
         # Build time-warp mapping
-        # We'll create a mapping from old time to new time
-        original_times = np.arange(len(audio)) / self.sr
-        warped_times = original_times.copy()
+        # We'll create a mapping from old time to new time. Every step below
+        # updates this one buffer in place: on a multi-minute file each
+        # float64 temporary is tens of MB.
+        warped_times = np.arange(len(audio), dtype=np.float64)
+        warped_times /= self.sr
         
-        # For each onset in target, shift it by interpolated groove amount
+        # Shift each onset by the interpolated groove amount. The template
+        # lookups don't depend on the onset, so they run once for all of them.
         beat_duration = 60.0 / target_bpm
         
-        for target_onset in target_onsets:
-            # Find which beat this onset is on
-            beat_position = target_onset / beat_duration
-            
-            # Find corresponding groove offset
-            # Use modulo to loop the groove template
-            template_length = groove_template.bpm * len(groove_template.offsets) / 60.0
-            template_beat = beat_position % template_length
-            
-            # Interpolate offset from template
-            template_beat_positions = groove_template.grid_positions / (60.0 / groove_template.bpm)
-            
-            if len(template_beat_positions) > 1:
-                offset_interp = np.interp(
-                    template_beat,
-                    template_beat_positions % template_length,
-                    groove_template.offsets
-                )
-            else:
-                offset_interp = 0
-            
-            # Apply offset with strength
-            offset = offset_interp * strength
-            
-            # Shift times around this onset
+        # Use modulo to loop the groove template
+        template_length = groove_template.bpm * len(groove_template.offsets) / 60.0
+        template_beats = (target_onsets / beat_duration) % template_length
+        
+        # Interpolate offsets from template
+        template_beat_positions = groove_template.grid_positions / (60.0 / groove_template.bpm)
+        if len(template_beat_positions) > 1:
+            onset_offsets = np.interp(
+                template_beats,
+                template_beat_positions % template_length,
+                groove_template.offsets
+            ) * strength
+        else:
+            onset_offsets = np.zeros(len(target_onsets))
+        
+        # Smooth transition using a gaussian window around each onset
+        window_size = int(0.1 * self.sr)  # 100ms window
+        distances = np.abs(np.arange(-window_size, window_size))
+        weights = np.exp(-(distances ** 2) / (2 * (window_size / 3) ** 2))
+        
+        for target_onset, offset in zip(target_onsets, onset_offsets):
             onset_sample = int(target_onset * self.sr)
-            window_size = int(0.1 * self.sr)  # 100ms window
+            window_start = onset_sample - window_size
             
-            start_idx = max(0, onset_sample - window_size)
+            start_idx = max(0, window_start)
             end_idx = min(len(warped_times), onset_sample + window_size)
             
-            # Create smooth transition using gaussian window
-            indices = np.arange(start_idx, end_idx)
-            center = onset_sample
-            distances = np.abs(indices - center)
-            weights = np.exp(-(distances ** 2) / (2 * (window_size / 3) ** 2))
-            
             # Apply time shift
-            warped_times[start_idx:end_idx] += offset * weights
+            warped_times[start_idx:end_idx] += offset * weights[start_idx - window_start:end_idx - window_start]
         
         # Ensure monotonically increasing
-        warped_times = np.maximum.accumulate(warped_times)
+        np.maximum.accumulate(warped_times, out=warped_times)
         
         # Resample audio using warped time mapping
         # We need to interpolate the audio at the new time positions
-        sample_indices = warped_times * self.sr
-        sample_indices = np.clip(sample_indices, 0, len(audio) - 1)
+        sample_indices = warped_times
+        sample_indices *= self.sr
+        np.clip(sample_indices, 0, len(audio) - 1, out=sample_indices)
         
         # Interpolate
         warped_audio = np.interp(
-            np.arange(len(audio)),
+            np.arange(len(audio), dtype=np.float64),
             sample_indices,
             audio
         )
@@ -10,6 +10,7 @@ import numpy as np
 from pathlib import Path
 from typing import Optional, Callable
 from dataclasses import dataclass
+from functools import lru_cache
 import librosa
 
 
@@ -276,17 +277,21 @@ class KeyDetector:
         return results
     
     @staticmethod
-    def get_scale_pitches(key: str, mode: str) -> list[int]:
+    @lru_cache(maxsize=64)
+    def get_scale_pitches(key: str, mode: str) -> tuple[int, ...]:
         """
         Get MIDI pitch classes for a given key/mode.
         Useful for pitch snapping in auto-tune.
         
+        Memoized: the result is an immutable tuple, so it's safe to share
+        across every track in a batch.
+        
         Args:
             key: Root note (e.g., "C", "F#")
             mode: "major" or "minor"
             
         Returns:
-            List of pitch classes (0-11) in the scale
+            Pitch classes (0-11) in the scale
         """
         note_to_num = {
             'C': 0, 'C#': 1, 'Db': 1, 'D': 2, 'D#': 3, 'Eb': 3,
@@ -301,7 +306,7 @@ class KeyDetector:
         root = note_to_num.get(key, 0)
         intervals = major_intervals if mode == 'major' else minor_intervals
         
-        return [(root + i) % 12 for i in intervals]
+        return tuple((root + i) % 12 for i in intervals)
     
     @staticmethod
     def pitch_to_nearest_scale(
@@ -164,23 +164,21 @@ class PitchEngine:
         # Detect pitch
         contour = self.detect_pitch(audio, sr)
         
-        # Calculate required shifts
+        # Calculate required shifts (all voiced frames at once)
         shift_cents = np.zeros_like(contour.frequencies)
+        voiced = contour.voiced_mask & (contour.frequencies > 0)
+        cents_to_target = self._snap_to_scale_cents(contour.frequencies[voiced], target_scale)
         
-        for i, (freq, voiced) in enumerate(zip(contour.frequencies, contour.voiced_mask)):
-            if not voiced or freq <= 0:
-                continue
-            
-            # Find target pitch in scale
-            _, cents_to_target = self._snap_to_scale(freq, target_scale)
-            
-            # Apply correction strength
-            shift_cents[i] = cents_to_target * correction_strength
-            
-            # Vibrato preservation: reduce correction for small deviations
-            if preserve_vibrato and abs(cents_to_target) < vibrato_threshold_cents:
-                # Smooth transition near target pitch
-                shift_cents[i] *= (abs(cents_to_target) / vibrato_threshold_cents)
+        # Apply correction strength
+        shifts = cents_to_target * correction_strength
+        
+        # Vibrato preservation: reduce correction for small deviations
+        if preserve_vibrato:
+            distance = np.abs(cents_to_target)
+            near = distance < vibrato_threshold_cents
+            shifts[near] *= distance[near] / vibrato_threshold_cents
+        
+        shift_cents[voiced] = shifts
         
         # Apply pitch shift using phase vocoder
         corrected = self._apply_pitch_shift_contour(audio, sr, shift_cents, contour.times)
@@ -271,6 +269,38 @@ class PitchEngine:
         
         return mixed
     
+    def _snap_to_scale_cents(
+        self,
+        freqs: np.ndarray,
+        scale_pitches: list[int],
+        reference_a4: float = 440.0
+    ) -> np.ndarray:
+        """
+        Vectorized _snap_to_scale: cents from each (positive) frequency to
+        the nearest pitch in scale, with the same tie-breaking.
+        """
+        midi = np.round(12 * np.log2(freqs / reference_a4) + 69).astype(np.int64)
+        pc = midi % 12
+        octave = midi // 12
+        
+        # First scale pitch at the smallest circular distance wins
+        min_dist = np.full(pc.shape, 12)
+        nearest_pc = pc.copy()
+        for spc in scale_pitches:
+            diff = np.abs(spc - pc)
+            dist = np.minimum(diff, 12 - diff)
+            closer = dist < min_dist
+            min_dist[closer] = dist[closer]
+            nearest_pc[closer] = spc
+        
+        # Handle octave boundaries
+        target_midi = octave * 12 + nearest_pc
+        target_midi += 12 * ((nearest_pc < pc) & (pc - nearest_pc > 6))
+        target_midi -= 12 * ((nearest_pc > pc) & (nearest_pc - pc > 6))
+        
+        target_freqs = reference_a4 * (2 ** ((target_midi - 69) / 12))
+        return 1200 * np.log2(target_freqs / freqs)
+    
     def _snap_to_scale(
         self, 
         freq: float, 
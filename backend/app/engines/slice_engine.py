@@ -91,6 +91,9 @@ class SliceBank:
     max_energy: float = 0.0
     energy_variance: float = 0.0
     
+    # (weight_by, temperature) -> (slices list, count, probabilities, cumulative)
+    _weight_cache: Dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    
     def __len__(self) -> int:
         return len(self.slices)
     
@@ -140,6 +143,36 @@ class SliceBank:
         if weight_by == 'uniform':
             return _rng.choice(self.slices)
         
+        probabilities, cumulative = self._weight_table(weight_by, temperature)
+        
+        # Use seeded selection if RNG provided
+        if rng is not None:
+            # First slice whose cumulative weight reaches r (last one if rounding leaves a gap)
+            i = int(np.searchsorted(cumulative, rng.random()))
+            return self.slices[min(i, len(self.slices) - 1)]
+        
+        return np.random.choice(self.slices, p=probabilities)
+    
+    def cumulative_weights(self, weight_by: str = 'energy', temperature: float = 1.0) -> np.ndarray:
+        """Cumulative selection probabilities used by get_random_weighted"""
+        return self._weight_table(weight_by, temperature)[1]
+    
+    def invalidate_weights(self):
+        """Drop cached weights after editing slice analysis values in place"""
+        self._weight_cache.clear()
+    
+    def _weight_table(self, weight_by: str, temperature: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Normalized weights and their cumsum, cached per (weight_by, temperature).
+        
+        Entries are tied to the current slices list and its length, so
+        replacing or appending slices rebuilds them.
+        """
+        key = (weight_by, temperature)
+        entry = self._weight_cache.get(key)
+        if entry is not None and entry[0] is self.slices and entry[1] == len(self.slices):
+            return entry[2], entry[3]
+        
         # Get weights based on attribute
         if weight_by == 'energy':
             weights = [s.rms_energy for s in self.slices]
@@ -151,23 +184,14 @@ class SliceBank:
             weights = [1.0] * len(self.slices)
         
         # Apply temperature
-        weights = np.array(weights) ** (1.0 / max(temperature, 0.01))
+        weights = np.array(weights, dtype=np.float64) ** (1.0 / max(temperature, 0.01))
         
         # Normalize to probabilities
-        weights = weights / (weights.sum() + 1e-8)
+        probabilities = weights / (weights.sum() + 1e-8)
+        cumulative = np.cumsum(probabilities)
         
-        # Use seeded selection if RNG provided
-        if rng is not None:
-            # Manual weighted selection using seeded RNG
-            r = rng.random()
-            cumsum = 0.0
-            for i, w in enumerate(weights):
-                cumsum += w
-                if r <= cumsum:
-                    return self.slices[i]
-            return self.slices[-1]
-        
-        return np.random.choice(self.slices, p=weights)
+        self._weight_cache[key] = (self.slices, len(self.slices), probabilities, cumulative)
+        return probabilities, cumulative
     
     def to_dict(self) -> Dict:
         return {
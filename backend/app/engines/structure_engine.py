@@ -15,10 +15,8 @@ class StructureEngine:
         using Self-Similarity Matrices (SSM) and Clustering.
         """
         from app.engines.torch_utils import load_audio
-        tensor = load_audio(str(audio_path), sr=self.sr)
-        y = tensor.cpu().numpy()
-        if y.ndim == 2:
-            y = np.mean(y, axis=0) # Mono for structure analysis
+        tensor = load_audio(str(audio_path), sr=self.sr, mono=True)  # Mono for structure analysis
+        y = tensor.cpu().numpy()[0]
         sr = self.sr
         
         # 1. Feature Extraction (MFCC + Chroma)
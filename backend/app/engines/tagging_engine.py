@@ -48,17 +48,12 @@ class TaggingEngine:
             # CLAP HTSAT expects 48000Hz.
             
             target_sr = 48000
-            waveform = load_audio(audio_path, sr=target_sr)
+            # Mixed to mono on-device, so only one channel comes back to host
+            waveform = load_audio(audio_path, sr=target_sr, mono=True)
             
             # Convert to numpy for processor (it handles tokenization etc)
             # Ideally we'd stay on GPU but transformers inputs are usually CPU/List
-            audio_np = waveform.cpu().numpy()
-            
-            # If stereo, mix to mono
-            if audio_np.ndim > 1 and audio_np.shape[0] > 1:
-                audio_np = audio_np.mean(axis=0)
-            elif audio_np.ndim > 1:
-                audio_np = audio_np[0]
+            audio_np = waveform.cpu().numpy()[0]
                 
             # Slice to 10s max to avoid memory issues and focus on intro/core
             max_len = target_sr * 10
@@ -11,8 +11,13 @@ def get_device() -> torch.device:
         return torch.device("cuda")
     return torch.device("cpu")
 
-def load_audio(path: str, sr: int = 44100, duration: Optional[float] = None) -> torch.Tensor:
-    """Load audio to tensor on device, resampling if needed."""
+def load_audio(path: str, sr: int = 44100, duration: Optional[float] = None, mono: bool = False) -> torch.Tensor:
+    """
+    Load audio to tensor on device, resampling if needed.
+    
+    With mono=True channels are averaged on-device (before resampling, so
+    only one channel is resampled) and the result is [1, samples].
+    """
     device = get_device()
     try:
         # Calculate num_frames if duration specified
@@ -28,6 +33,8 @@ def load_audio(path: str, sr: int = 44100, duration: Optional[float] = None) ->
             waveform, orig_sr = torchaudio.load(path)
             
         waveform = waveform.to(device)
+        if mono and waveform.shape[0] > 1:
+            waveform = waveform.mean(dim=0, keepdim=True)
         
         if orig_sr != sr:
             resampler = torchaudio.transforms.Resample(orig_sr, sr).to(device)
@@ -36,7 +43,7 @@ def load_audio(path: str, sr: int = 44100, duration: Optional[float] = None) ->
         return waveform
     except Exception as e:
         print(f"[TORCH] Load failed: {e}")
-        return torch.zeros(2, sr).to(device)
+        return torch.zeros(1 if mono else 2, sr).to(device)
 
 def save_audio(path: str, waveform: torch.Tensor, sr: int):
     """Save tensor to audio file."""
@@ -44,38 +51,48 @@ def save_audio(path: str, waveform: torch.Tensor, sr: int):
     waveform = waveform.detach().cpu()
     torchaudio.save(path, waveform, sr)
 
-def pitch_shift(waveform: torch.Tensor, sr: int, n_steps: float) -> torch.Tensor:
+def pitch_shift_array(audio: "np.ndarray", sr: int, n_steps: float) -> "np.ndarray":
     """
-    High-quality pitch shift using Pedalboard (GPU-accelerated via JUCE).
-    Avoids MPS ISTFT bugs. Preserves duration.
+    Pedalboard pitch shift on a host array ([samples] or [channels, samples]).
+    
+    For callers that already hold NumPy audio, so they don't bounce it
+    through a device tensor just for pitch_shift to bring it back.
     """
-    if n_steps == 0:
-        return waveform
-        
-    from pedalboard import Pedalboard, PitchShift
     import numpy as np
     
-    device = waveform.device
+    if n_steps == 0:
+        return audio
     
-    # Convert to numpy for pedalboard
-    # waveform: [channels, samples]
-    audio_np = waveform.detach().cpu().numpy().astype(np.float32)
+    from pedalboard import Pedalboard, PitchShift
     
-    # Apply pitch shift
+    audio_np = np.asarray(audio, dtype=np.float32)
     board = Pedalboard([PitchShift(semitones=n_steps)])
-    shifted_np = board(audio_np, sr)
-    
-    # Convert back to tensor
-    shifted = torch.from_numpy(shifted_np).float().to(device)
+    shifted = board(audio_np[None] if audio_np.ndim == 1 else audio_np, sr)
+    if audio_np.ndim == 1:
+        shifted = shifted[0]
     
     # Ensure same length (pedalboard might add/remove samples)
-    if shifted.shape[-1] > waveform.shape[-1]:
-        shifted = shifted[..., :waveform.shape[-1]]
-    elif shifted.shape[-1] < waveform.shape[-1]:
-        shifted = torch.nn.functional.pad(shifted, (0, waveform.shape[-1] - shifted.shape[-1]))
-        
+    length = audio_np.shape[-1]
+    if shifted.shape[-1] > length:
+        shifted = shifted[..., :length]
+    elif shifted.shape[-1] < length:
+        pad = [(0, 0)] * (shifted.ndim - 1) + [(0, length - shifted.shape[-1])]
+        shifted = np.pad(shifted, pad)
+    
     return shifted
 
+def pitch_shift(waveform: torch.Tensor, sr: int, n_steps: float) -> torch.Tensor:
+    """
+    High-quality pitch shift using Pedalboard (GPU-accelerated via JUCE).
+    Avoids MPS ISTFT bugs. Preserves duration.
+    """
+    if n_steps == 0:
+        return waveform
+    
+    # waveform: [channels, samples]; pedalboard runs on the host
+    shifted_np = pitch_shift_array(waveform.detach().cpu().numpy(), sr, n_steps)
+    return torch.from_numpy(shifted_np).float().to(waveform.device)
+
 def apply_convolution(waveform: torch.Tensor, kernel_size: int = 20) -> torch.Tensor:
     """Apply smoothing convolution (low-pass) on GPU."""
     device = waveform.device
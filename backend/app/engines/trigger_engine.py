@@ -15,13 +15,32 @@ then I'll do this.'" - Sean Booth
 """
 
 import numpy as np
-from typing import List, Dict, Optional, Callable, Tuple, Any
-from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Optional, Callable, Tuple, Any, Type, Deque
+from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from functools import lru_cache
+import operator
+import threading
 import random
 import json
 
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # Optional: pure-Python fallbacks are used without it
+    _HAS_NUMBA = False
+
+
+# Memoized get_trigger_times_array output for deterministic sources, keyed on
+# (source _cache_key(), duration_beats, bpm). Shared across instances so
+# per-request sources with identical parameters hit the same entry.
+_TRIGGER_TIMES_CACHE: 'OrderedDict[Tuple, np.ndarray]' = OrderedDict()
+_TRIGGER_TIMES_CACHE_SIZE = 256
+_TRIGGER_TIMES_LOCK = threading.Lock()
+
 
 class TriggerMode(Enum):
     """How the sequencer selects slices"""
@@ -36,7 +55,7 @@ class TriggerMode(Enum):
     FOOTWORK = "footwork"            # Footwork-specific sequencing
 
 
-@dataclass
+@dataclass(slots=True)
 class TriggerEvent:
     """
     A single trigger event in a sequence.
@@ -63,14 +82,30 @@ class TriggerEvent:
     rule_modified: bool = False         # Was this modified by a rule?
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Explicit literal: every field is a scalar, so asdict()'s recursive deep copy is wasted work
+        return {
+            'time': self.time,
+            'slice_index': self.slice_index,
+            'velocity': self.velocity,
+            'duration': self.duration,
+            'pitch_shift': self.pitch_shift,
+            'reverse': self.reverse,
+            'pan': self.pan,
+            'filter_cutoff': self.filter_cutoff,
+            'micro_offset': self.micro_offset,
+            'envelope_sweep': self.envelope_sweep,
+            'saturation_amount': self.saturation_amount,
+            'swing_amount': self.swing_amount,
+            'triggered_by': self.triggered_by,
+            'rule_modified': self.rule_modified,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'TriggerEvent':
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
 
-@dataclass
+@dataclass(slots=True)
 class TriggerRule:
     """
     A conditional rule that modifies sequence behavior.
@@ -101,11 +136,342 @@ class TriggerRule:
     # - "reset_sequence" - go back to start
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            'id': self.id,
+            'name': self.name,
+            'condition': self.condition,
+            'action': self.action,
+            'probability': self.probability,
+            'enabled': self.enabled,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'TriggerRule':
-        return cls(**data)
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+# Condition keyword -> (state key it reads, operators the evaluator understands).
+# Order matters: the first keyword found in the condition string wins.
+_CONDITION_GRAMMAR = (
+    ('consecutive_plays', 'consecutive_plays', ('>', '>=', '==')),
+    ('total_plays', 'total_plays', ('>', '%')),
+    ('slice_index', 'last_slice_index', ('==', '!=')),
+)
+
+_CONDITION_OPS: Dict[str, Callable[[int, int], bool]] = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '%': lambda a, b: a % b == 0,  # Modulo - fires every N plays
+}
+
+# Rule action -> returns True when the next trigger should be skipped.
+RuleAction = Callable[['TriggerEngine', 'TriggerEvent', int], bool]
+
+
+def _parse_condition(condition: str) -> Optional[Tuple[str, str, int]]:
+    """
+    Parse a rule condition into (state_key, op, value).
+    
+    Returns None for conditions that can never fire (unknown keyword or
+    operator, malformed threshold, modulo by zero).
+    """
+    for keyword, state_key, ops in _CONDITION_GRAMMAR:
+        if keyword in condition:
+            parts = condition.replace(keyword, "").strip().split()
+            if len(parts) < 2 or parts[0] not in ops:
+                return None
+            try:
+                value = int(parts[1])
+            except ValueError:
+                return None
+            if parts[0] == '%' and value == 0:
+                return None
+            return state_key, parts[0], value
+    return None
+
+
+@lru_cache(maxsize=256)
+def _compile_condition(condition: str) -> Optional[Callable[['TriggerState'], bool]]:
+    """
+    Compile a condition string into a predicate over TriggerState.
+    
+    Cached per distinct string, so every rule sharing a condition (and every
+    sequence render) reuses one closure. None if the condition never fires.
+    """
+    parsed = _parse_condition(condition)
+    if parsed is None:
+        return None
+    
+    state_key, op, value = parsed
+    read = operator.attrgetter(state_key)
+    compare = _CONDITION_OPS[op]
+    
+    def check(state: 'TriggerState') -> bool:
+        return compare(read(state), value)
+    
+    return check
+
+
+def _pitch_action(semitones: int) -> RuleAction:
+    def shift(engine: 'TriggerEngine', event: 'TriggerEvent', num_slices: int) -> bool:
+        event.pitch_shift += semitones
+        return False
+    return shift
+
+
+def _noop_action(engine: 'TriggerEngine', event: 'TriggerEvent', num_slices: int) -> bool:
+    return False
+
+
+@lru_cache(maxsize=256)
+def _compile_action(action: str) -> RuleAction:
+    """Compile an action string into a handler taking (engine, event, num_slices)"""
+    handler = getattr(TriggerEngine, f'_action_{action}', None)
+    if handler is not None:
+        return handler
+    
+    for prefix, sign in (('pitch_up_', 1), ('pitch_down_', -1)):
+        if action.startswith(prefix):
+            try:
+                return _pitch_action(sign * int(action.replace(prefix, "")))
+            except ValueError:
+                break
+    
+    return _noop_action
+
+
+@dataclass(slots=True)
+class _CompiledRule:
+    """
+    An enabled rule with its condition/action compiled to callables, plus
+    cheap necessary-condition gates derived from its threshold.
+    
+    A rule whose gate isn't met can't fire, so the engine skips it without
+    evaluating the full condition.
+    """
+    rule: TriggerRule
+    position: int                    # Index among compiled rules (batched draw column)
+    state_key: str
+    op: str
+    value: int
+    check: Callable[['TriggerState'], bool]
+    act: RuleAction
+    min_total_plays: int = 0
+    min_consecutive: int = 0
+    
+    @classmethod
+    def compile(cls, rule: TriggerRule, position: int) -> Optional['_CompiledRule']:
+        check = _compile_condition(rule.condition)
+        if check is None:
+            return None
+        
+        state_key, op, value = _parse_condition(rule.condition)
+        compiled = cls(
+            rule=rule,
+            position=position,
+            state_key=state_key,
+            op=op,
+            value=value,
+            check=check,
+            act=_compile_action(rule.action),
+        )
+        if state_key == 'total_plays' and op == '>':
+            compiled.min_total_plays = value + 1
+        elif state_key == 'consecutive_plays':
+            compiled.min_consecutive = value + 1 if op == '>' else value
+        return compiled
+
+
+# Numeric rule encoding for the JIT sequence kernel
+_RULE_FIELD_CODES = {'consecutive_plays': 0, 'total_plays': 1, 'last_slice_index': 2}
+_RULE_OP_CODES = {'>': 0, '>=': 1, '==': 2, '!=': 3, '%': 4}
+_RULE_ACTION_CODES = {
+    'skip_next': 1, 'reverse': 2, 'reset_sequence': 3, 'half_velocity': 4, 'double_velocity': 5,
+}
+_RULE_ACTION_PITCH = 6
+_RULES_JIT_MIN_EVENTS = 256  # Shorter sequences don't amortize the kernel call
+
+
+def _encode_rules(compiled_rules: List['_CompiledRule']) -> Optional[Tuple[np.ndarray, ...]]:
+    """
+    (fields, ops, values, actions, action_args, probabilities) arrays for
+    _run_rules_jit, or None if an action needs the engine's Python RNG.
+    """
+    num_rules = len(compiled_rules)
+    fields = np.empty(num_rules, dtype=np.int64)
+    ops = np.empty(num_rules, dtype=np.int64)
+    values = np.empty(num_rules, dtype=np.int64)
+    actions = np.zeros(num_rules, dtype=np.int64)  # 0: no-op (double_trigger, unknown names)
+    action_args = np.zeros(num_rules, dtype=np.int64)
+    probabilities = np.empty(num_rules, dtype=np.float64)
+    
+    for r, crule in enumerate(compiled_rules):
+        action = crule.rule.action
+        if action == 'random_slice':
+            return None
+        fields[r] = _RULE_FIELD_CODES[crule.state_key]
+        ops[r] = _RULE_OP_CODES[crule.op]
+        values[r] = crule.value
+        probabilities[r] = crule.rule.probability
+        if action in _RULE_ACTION_CODES:
+            actions[r] = _RULE_ACTION_CODES[action]
+        else:
+            for prefix, sign in (('pitch_up_', 1), ('pitch_down_', -1)):
+                if action.startswith(prefix):
+                    try:
+                        action_args[r] = sign * int(action.replace(prefix, ""))
+                        actions[r] = _RULE_ACTION_PITCH
+                    except ValueError:
+                        pass
+                    break
+    
+    return fields, ops, values, actions, action_args, probabilities
+
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _run_rules_jit(times, velocities, num_slices, rolls, fields, ops, values, actions, action_args, probabilities):
+        """
+        The ordered-mode (total_plays % num_slices) sequence loop with rules.
+        
+        Mirrors TriggerEngine._sequence_from_times event for event. Returns
+        per-event arrays (source trigger index, slice, velocity, pitch,
+        reverse, rule_modified), the event count, and the final state
+        (last slice, consecutive, total, last time, first event after the
+        last reset_sequence).
+        """
+        n = times.shape[0]
+        num_rules = fields.shape[0]
+        out_source = np.empty(n, dtype=np.int64)
+        out_slice = np.empty(n, dtype=np.int64)
+        out_velocity = np.empty(n, dtype=np.float64)
+        out_pitch = np.zeros(n, dtype=np.int64)
+        out_reverse = np.zeros(n, dtype=np.bool_)
+        out_modified = np.zeros(n, dtype=np.bool_)
+        
+        last = -1
+        consecutive = 0
+        total = 0
+        last_time = 0.0
+        history_start = 0
+        count = 0
+        skip_next = False
+        
+        for i in range(n):
+            if skip_next:
+                skip_next = False
+                continue
+            
+            slice_index = total % num_slices
+            velocity = velocities[i]
+            
+            if slice_index == last:
+                consecutive += 1
+            else:
+                consecutive = 1
+            last = slice_index
+            total += 1
+            
+            for r in range(num_rules):
+                if fields[r] == 0:
+                    current = consecutive
+                elif fields[r] == 1:
+                    current = total
+                else:
+                    current = last
+                
+                op = ops[r]
+                value = values[r]
+                if op == 0:
+                    fired = current > value
+                elif op == 1:
+                    fired = current >= value
+                elif op == 2:
+                    fired = current == value
+                elif op == 3:
+                    fired = current != value
+                else:
+                    fired = current % value == 0
+                
+                if fired and rolls[i, r] < probabilities[r]:
+                    action = actions[r]
+                    if action == 1:
+                        skip_next = True
+                    elif action == 2:
+                        out_reverse[count] = not out_reverse[count]
+                    elif action == 3:
+                        last = -1
+                        consecutive = 0
+                        total = 0
+                        history_start = count + 1
+                    elif action == 4:
+                        velocity *= 0.5
+                    elif action == 5:
+                        velocity = min(1.0, velocity * 2)
+                    elif action == 6:
+                        out_pitch[count] += action_args[r]
+                    out_modified[count] = True
+            
+            out_source[count] = i
+            out_slice[count] = slice_index
+            out_velocity[count] = velocity
+            last_time = times[i]
+            count += 1
+        
+        return (
+            out_source, out_slice, out_velocity, out_pitch, out_reverse, out_modified,
+            count, last, consecutive, total, last_time, history_start,
+        )
+
+
+PLAY_HISTORY_LENGTH = 16  # Slice indices kept in TriggerState.play_history
+
+
+@dataclass(slots=True)
+class TriggerState:
+    """
+    Running state the rules are evaluated against.
+    
+    Slot attributes instead of a dict keep per-event reads cheap; item
+    access (state['total_plays']) is still supported for older callers.
+    """
+    last_slice_index: int = -1
+    consecutive_plays: int = 0
+    total_plays: int = 0
+    play_history: Deque[int] = field(default_factory=lambda: deque(maxlen=PLAY_HISTORY_LENGTH))  # Last N slice indices
+    last_trigger_time: float = 0.0
+    
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value: Any):
+        setattr(self, key, value)
+    
+    def reset(self):
+        """Back to a fresh state in place, so aliases held by the sequence loop stay valid"""
+        self.last_slice_index = -1
+        self.consecutive_plays = 0
+        self.total_plays = 0
+        self.play_history.clear()
+        self.last_trigger_time = 0.0
+
+
+def _first_within(sorted_times: np.ndarray, order: np.ndarray, time: float, tolerance: float) -> Optional[int]:
+    """
+    Original position of the first entry within tolerance of time.
+    
+    sorted_times/order come from a stable argsort, so ties resolve to the
+    earliest entry in the source list, matching a linear scan.
+    """
+    best = None
+    j = int(np.searchsorted(sorted_times, time - tolerance, side='left'))
+    while j < len(sorted_times) and sorted_times[j] <= time + tolerance:
+        if abs(sorted_times[j] - time) < tolerance and (best is None or order[j] < best):
+            best = int(order[j])
+        j += 1
+    return best
 
 
 class TriggerSource(ABC):
@@ -115,16 +481,85 @@ class TriggerSource(ABC):
     Subclasses determine WHEN triggers should fire.
     """
     
+    # True when get_trigger_times draws random numbers (output varies per seed)
+    stochastic = False
+    
+    # False when the output is a pure function of parameters and duration_beats;
+    # bpm is then left out of the cache key so one entry serves every tempo
+    uses_bpm = True
+    
+    # Source type name -> class, filled in as subclasses are defined; used by from_dict
+    _registry: Dict[str, Type['TriggerSource']] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        TriggerSource._registry[cls.__name__] = cls
+    
     @abstractmethod
     def get_trigger_times(self, duration_beats: float, bpm: float) -> List[float]:
         """Return list of times (in beats) when triggers should fire"""
         pass
     
+    def get_trigger_times_array(self, duration_beats: float, bpm: float) -> np.ndarray:
+        """Trigger times as a float64 array; vectorized sources override this directly"""
+        return np.asarray(self.get_trigger_times(duration_beats, bpm), dtype=np.float64)
+    
     @abstractmethod
     def get_velocity(self, time: float) -> float:
         """Return velocity/intensity at a given time"""
         pass
     
+    def get_velocities(self, times: np.ndarray) -> np.ndarray:
+        """Velocities for many trigger times at once; override when vectorizable"""
+        return np.fromiter(map(self.get_velocity, times), dtype=np.float64, count=len(times))
+    
+    def set_rng(self, rng: np.random.Generator):
+        """Share the engine's seeded generator (no-op for deterministic sources)"""
+        pass
+    
+    def _cache_key(self) -> Optional[Tuple]:
+        """
+        Hashable snapshot of every parameter get_trigger_times depends on.
+        
+        None means the output can't be memoized (mutable note lists etc.).
+        """
+        return None
+    
+    def get_trigger_times_cached(self, duration_beats: float, bpm: float) -> List[float]:
+        """get_trigger_times, memoized for deterministic sources"""
+        return self.get_trigger_times_array_cached(duration_beats, bpm).tolist()
+    
+    def get_trigger_times_array_cached(self, duration_beats: float, bpm: float) -> np.ndarray:
+        """
+        get_trigger_times_array, memoized for deterministic sources.
+        
+        Cached arrays are shared between callers and marked read-only.
+        """
+        key = None if self.stochastic else self._cache_key()
+        if key is None:
+            return self.get_trigger_times_array(duration_beats, bpm)
+        
+        full_key = (key, duration_beats, bpm if self.uses_bpm else None)
+        try:
+            hash(full_key)
+        except TypeError:
+            # Unhashable parameter (e.g. a nested list in a layer config)
+            return self.get_trigger_times_array(duration_beats, bpm)
+        
+        with _TRIGGER_TIMES_LOCK:
+            times = _TRIGGER_TIMES_CACHE.get(full_key)
+            if times is not None:
+                _TRIGGER_TIMES_CACHE.move_to_end(full_key)
+                return times
+        
+        times = np.array(self.get_trigger_times_array(duration_beats, bpm), dtype=np.float64)
+        times.flags.writeable = False
+        with _TRIGGER_TIMES_LOCK:
+            _TRIGGER_TIMES_CACHE[full_key] = times
+            if len(_TRIGGER_TIMES_CACHE) > _TRIGGER_TIMES_CACHE_SIZE:
+                _TRIGGER_TIMES_CACHE.popitem(last=False)
+        return times
+    
     def to_dict(self) -> Dict:
         return {'type': self.__class__.__name__}
     
@@ -138,26 +573,8 @@ class TriggerSource(ABC):
         if not data:
             return GridTriggerSource()
         
-        source_type = data.get('type', 'GridTriggerSource')
-        
-        # Map source types to their from_dict methods
-        source_map = {
-            'EuclideanTriggerSource': EuclideanTriggerSource.from_dict,
-            'MIDITriggerSource': MIDITriggerSource.from_dict,
-            'TransientFollowSource': TransientFollowSource.from_dict,
-            'ProbabilityTriggerSource': ProbabilityTriggerSource.from_dict,
-            'PolyrhythmicTriggerSource': PolyrhythmicTriggerSource.from_dict,
-            'MicroTimingTriggerSource': MicroTimingTriggerSource.from_dict,
-            'JukePatternTriggerSource': JukePatternTriggerSource.from_dict,
-            'OffbeatTriggerSource': OffbeatTriggerSource.from_dict,
-        }
-        
-        factory = source_map.get(source_type)
-        if factory:
-            return factory(data)
-        
-        # Default to GridTriggerSource
-        return GridTriggerSource.from_dict(data)
+        source_cls = TriggerSource._registry.get(data.get('type', 'GridTriggerSource'), GridTriggerSource)
+        return source_cls.from_dict(data)
 
 
 class GridTriggerSource(TriggerSource):
@@ -165,6 +582,8 @@ class GridTriggerSource(TriggerSource):
     Simple grid-based triggering at regular intervals.
     """
     
+    uses_bpm = False
+    
     def __init__(self, subdivision: float = 1.0, offset: float = 0.0):
         """
         Args:
@@ -175,17 +594,24 @@ class GridTriggerSource(TriggerSource):
         self.offset = offset
     
     def get_trigger_times(self, duration_beats: float, bpm: float) -> List[float]:
-        step = 1.0 / self.subdivision
-        times = []
-        t = self.offset
-        while t < duration_beats:
-            times.append(t)
-            t += step
-        return times
+        return self.get_trigger_times_array(duration_beats, bpm).tolist()
+    
+    def get_trigger_times_array(self, duration_beats: float, bpm: float) -> np.ndarray:
+        num_steps = int(np.ceil((duration_beats - self.offset) * self.subdivision))
+        if num_steps <= 0:
+            return np.empty(0)
+        times = self.offset + np.arange(num_steps, dtype=np.float64) / self.subdivision
+        return times[times < duration_beats]
     
     def get_velocity(self, time: float) -> float:
         return 1.0
     
+    def get_velocities(self, times: np.ndarray) -> np.ndarray:
+        return np.ones(len(times))
+    
+    def _cache_key(self) -> Optional[Tuple]:
+        return ('grid', self.subdivision, self.offset)
+    
     def to_dict(self) -> Dict:
         return {
             'type': 'GridTriggerSource',
@@ -201,6 +627,96 @@ class GridTriggerSource(TriggerSource):
         )
 
 
+# Patterns at least this long use the JIT level builder (e.g. 256th-note grids)
+_BJORKLUND_JIT_MIN_STEPS = 256
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _bjorklund_levels_jit(counts: np.ndarray, remainders: np.ndarray, steps: int) -> np.ndarray:
+        """Same level unrolling as _bjorklund_pattern, on three rotating bool buffers"""
+        before = np.empty(steps, dtype=np.bool_)
+        previous = np.empty(steps, dtype=np.bool_)
+        current = np.empty(steps, dtype=np.bool_)
+        before[0] = True
+        previous[0] = False
+        before_len = 1
+        previous_len = 1
+        
+        for lvl in range(counts.shape[0]):
+            n = 0
+            for _ in range(counts[lvl]):
+                current[n:n + previous_len] = previous[:previous_len]
+                n += previous_len
+            if remainders[lvl] != 0:
+                current[n:n + before_len] = before[:before_len]
+                n += before_len
+            before, previous, current = previous, current, before
+            before_len, previous_len = previous_len, n
+        
+        return previous[:previous_len].copy()
+
+
+@lru_cache(maxsize=512)
+def _bjorklund_pattern(hits: int, steps: int, rotation: int = 0) -> Tuple[bool, ...]:
+    """
+    Bjorklund's algorithm for Euclidean rhythms.
+    
+    Distributes hits as evenly as possible across steps. Memoized: the
+    result is an immutable tuple, so it's safe to share across instances
+    (PolyrhythmicTriggerSource builds fresh Euclidean layers every render).
+    """
+    if steps == 0:
+        return ()
+    if hits == 0:
+        return (False,) * steps
+    if hits >= steps:
+        return (True,) * steps
+    
+    # Bjorklund's algorithm
+    counts = []
+    remainders = []
+    
+    divisor = steps - hits
+    remainders.append(hits)
+    level = 0
+    
+    while remainders[level] > 1:
+        counts.append(divisor // remainders[level])
+        remainders.append(divisor % remainders[level])
+        divisor = remainders[level]
+        level += 1
+    
+    counts.append(divisor)
+    
+    # Unrolled build(): level -2 is a hit, level -1 a rest, and each level is
+    # the previous level repeated counts[level] times plus (when there is a
+    # remainder) one copy of the level before that. List repetition runs in C
+    # and there's no recursion depth limit for large step counts.
+    if _HAS_NUMBA and steps >= _BJORKLUND_JIT_MIN_STEPS:
+        previous = _bjorklund_levels_jit(
+            np.asarray(counts, dtype=np.int64),
+            np.asarray(remainders[:level + 1], dtype=np.int64),
+            steps,
+        ).tolist()
+    else:
+        before, previous = [True], [False]
+        for lvl in range(level + 1):
+            current = previous * counts[lvl]
+            if remainders[lvl] != 0:
+                current += before
+            before, previous = previous, current
+    
+    # Start the cycle on a hit (E(3, 8) = x..x..x.)
+    first_hit = previous.index(True)
+    pattern = previous[first_hit:] + previous[:first_hit]
+    
+    # Apply rotation
+    if rotation > 0:
+        pattern = pattern[rotation:] + pattern[:rotation]
+    
+    return tuple(pattern)
+
+
 class EuclideanTriggerSource(TriggerSource):
     """
     Generate triggers using Euclidean rhythms.
@@ -210,6 +726,8 @@ class EuclideanTriggerSource(TriggerSource):
     many world music traditions.
     """
     
+    uses_bpm = False
+    
     def __init__(self, hits: int, steps: int, rotation: int = 0):
         """
         Args:
@@ -220,83 +738,37 @@ class EuclideanTriggerSource(TriggerSource):
         self.hits = min(hits, steps)
         self.steps = steps
         self.rotation = rotation % steps if steps > 0 else 0
-        self._pattern = self._generate_pattern()
-    
-    def _generate_pattern(self) -> List[bool]:
-        """
-        Bjorklund's algorithm for Euclidean rhythms.
-        
-        Distributes hits as evenly as possible across steps.
-        """
-        if self.steps == 0:
-            return []
-        if self.hits == 0:
-            return [False] * self.steps
-        if self.hits >= self.steps:
-            return [True] * self.steps
-        
-        # Bjorklund's algorithm
-        pattern = []
-        counts = []
-        remainders = []
-        
-        divisor = self.steps - self.hits
-        remainders.append(self.hits)
-        level = 0
-        
-        while remainders[level] > 1:
-            counts.append(divisor // remainders[level])
-            remainders.append(divisor % remainders[level])
-            divisor = remainders[level]
-            level += 1
-        
-        counts.append(divisor)
-        
-        def build(level: int) -> List[bool]:
-            if level == -1:
-                return [True]
-            elif level == -2:
-                return [False]
-            else:
-                pattern = []
-                for _ in range(counts[level]):
-                    pattern.extend(build(level - 1))
-                if remainders[level] != 0:
-                    pattern.extend(build(level - 2))
-                return pattern
-        
-        pattern = build(level)
-        
-        # Apply rotation
-        if self.rotation > 0:
-            pattern = pattern[self.rotation:] + pattern[:self.rotation]
-        
-        return pattern
+        self._pattern = _bjorklund_pattern(self.hits, self.steps, self.rotation)
+        # Step indices of the hits: a repeat costs O(hits) rather than O(steps)
+        self._hit_steps = np.flatnonzero(self._pattern)
     
     def get_trigger_times(self, duration_beats: float, bpm: float) -> List[float]:
+        return self.get_trigger_times_array(duration_beats, bpm).tolist()
+    
+    def get_trigger_times_array(self, duration_beats: float, bpm: float) -> np.ndarray:
         if not self._pattern:
-            return []
+            return np.empty(0)
         
         step_duration = duration_beats / self.steps
-        times = []
         
         # Repeat pattern as needed to fill duration
         pattern_duration = len(self._pattern) * step_duration
         num_repeats = int(np.ceil(duration_beats / pattern_duration))
         
-        for repeat in range(num_repeats):
-            for i, hit in enumerate(self._pattern):
-                if hit:
-                    time = repeat * pattern_duration + i * step_duration
-                    if time < duration_beats:
-                        times.append(time)
-        
-        return times
+        hit_steps = np.arange(num_repeats)[:, None] * self.steps + self._hit_steps[None, :]
+        times = hit_steps.ravel() * step_duration
+        return times[times < duration_beats]
     
     def get_velocity(self, time: float) -> float:
         # Could implement accent patterns here
         return 1.0
     
+    def get_velocities(self, times: np.ndarray) -> np.ndarray:
+        return np.ones(len(times))
+    
+    def _cache_key(self) -> Optional[Tuple]:
+        return ('euclidean', self.hits, self.steps, self.rotation)
+    
     def to_dict(self) -> Dict:
         return {
             'type': 'EuclideanTriggerSource',
@@ -331,29 +803,40 @@ class MIDITriggerSource(TriggerSource):
     ):
         self.notes = notes or []
         self.base_note = base_note
-        self._times_cache = None
+        self._index = None  # (sorted times, list positions) built lazily
     
     def add_note(self, time: float, note: int, velocity: int = 100):
         """Add a MIDI note to the pattern"""
         self.notes.append({'time': time, 'note': note, 'velocity': velocity})
         self.notes.sort(key=lambda x: x['time'])
-        self._times_cache = None
+        self._index = None
+    
+    def _rebuild_index(self):
+        """Sort note times once so lookups are a binary search instead of a scan"""
+        times = np.array([n['time'] for n in self.notes], dtype=np.float64)
+        order = np.argsort(times, kind='stable')
+        self._index = (times[order], order, len(self.notes))
+    
+    def _find_note(self, time: float) -> Optional[Dict]:
+        """First note (in list order) within 1ms-of-a-beat tolerance of time"""
+        if self._index is None or self._index[2] != len(self.notes):
+            self._rebuild_index()
+        times, order, _ = self._index
+        
+        best = _first_within(times, order, time, 0.001)
+        return None if best is None else self.notes[best]
     
     def get_trigger_times(self, duration_beats: float, bpm: float) -> List[float]:
         return [n['time'] for n in self.notes if n['time'] < duration_beats]
     
     def get_velocity(self, time: float) -> float:
-        for note in self.notes:
-            if abs(note['time'] - time) < 0.001:
-                return note['velocity'] / 127.0
-        return 1.0
+        note = self._find_note(time)
+        return note['velocity'] / 127.0 if note is not None else 1.0
     
     def get_slice_index(self, time: float) -> int:
         """Get the slice index for a trigger at this time"""
-        for note in self.notes:
-            if abs(note['time'] - time) < 0.001:
-                return note['note'] - self.base_note
-        return 0
+        note = self._find_note(time)
+        return note['note'] - self.base_note if note is not None else 0
     
     def to_dict(self) -> Dict:
         return {
@@ -432,38 +915,46 @@ class ProbabilityTriggerSource(TriggerSource):
     Like Elektron-style parameter locks, but for trigger probability.
     """
     
+    stochastic = True
+    
     def __init__(
         self,
         steps: int = 16,
         probabilities: List[float] = None,  # Probability for each step (0-1)
         subdivision: float = 1.0,  # Steps per beat
+        seed: Optional[int] = None,
     ):
         self.steps = steps
         self.probabilities = probabilities or [1.0] * steps
         self.subdivision = subdivision
+        self._rng_np = np.random.default_rng(seed)
         
         # Ensure probabilities list matches steps
         while len(self.probabilities) < steps:
             self.probabilities.append(1.0)
     
+    def set_rng(self, rng: np.random.Generator):
+        self._rng_np = rng
+    
     def get_trigger_times(self, duration_beats: float, bpm: float) -> List[float]:
-        step_duration = 1.0 / self.subdivision
-        times = []
-        
-        step = 0
-        time = 0.0
-        while time < duration_beats:
-            prob = self.probabilities[step % len(self.probabilities)]
-            if random.random() < prob:
-                times.append(time)
-            time += step_duration
-            step += 1
+        return self.get_trigger_times_array(duration_beats, bpm).tolist()
+    
+    def get_trigger_times_array(self, duration_beats: float, bpm: float) -> np.ndarray:
+        num_steps = int(np.ceil(duration_beats * self.subdivision))
+        if num_steps <= 0:
+            return np.empty(0)
         
-        return times
+        # One batched draw for every step instead of a Python RNG call per step
+        probs = np.resize(np.asarray(self.probabilities, dtype=np.float64), num_steps)
+        times = np.flatnonzero(self._rng_np.random(num_steps) < probs) / self.subdivision
+        return times[times < duration_beats]
     
     def get_velocity(self, time: float) -> float:
         return 1.0
     
+    def get_velocities(self, times: np.ndarray) -> np.ndarray:
+        return np.ones(len(times))
+    
     def to_dict(self) -> Dict:
         return {
             'type': 'ProbabilityTriggerSource',
@@ -489,6 +980,10 @@ class PolyrhythmicTriggerSource(TriggerSource):
     (e.g., kick on 4/4, snare on 3/4, hats on 5/8).
     """
     
+    uses_bpm = False
+    
+    TICKS_PER_BEAT = 1920  # Dedup resolution when merging layers (MIDI-style PPQN)
+    
     def __init__(
         self,
         layers: List[Dict] = None,  # Each layer: {'hits': int, 'steps': int, 'subdivision': float, 'offset': float}
@@ -506,15 +1001,18 @@ class PolyrhythmicTriggerSource(TriggerSource):
         ]
     
     def get_trigger_times(self, duration_beats: float, bpm: float) -> List[float]:
+        return self.get_trigger_times_array(duration_beats, bpm).tolist()
+    
+    def get_trigger_times_array(self, duration_beats: float, bpm: float) -> np.ndarray:
         """
         Generate trigger times from all polyrhythmic layers.
         
         Each layer generates its own pattern, then all are merged and sorted.
         """
-        all_times = []
-        
         if not self.layers:
-            return []
+            return np.empty(0)
+        
+        layer_arrays = []
         
         for layer_idx, layer in enumerate(self.layers):
             try:
@@ -525,29 +1023,39 @@ class PolyrhythmicTriggerSource(TriggerSource):
                 
                 # Use Euclidean pattern for each layer
                 euclidean = EuclideanTriggerSource(hits=min(hits, steps), steps=steps)
-                layer_times = euclidean.get_trigger_times(duration_beats, bpm)
+                layer_times = euclidean.get_trigger_times_array(duration_beats, bpm)
                 
                 # Apply subdivision and offset
                 step_duration = 1.0 / subdivision
-                for time in layer_times:
-                    adjusted_time = (time * step_duration) + offset
-                    # Validate time is within bounds
-                    if 0 <= adjusted_time < duration_beats:
-                        all_times.append(adjusted_time)
+                adjusted = layer_times * step_duration + offset
+                # Validate time is within bounds
+                layer_arrays.append(adjusted[(adjusted >= 0) & (adjusted < duration_beats)])
             except Exception as e:
                 # Log error but continue with other layers
                 import logging
                 logging.warning(f"Error processing polyrhythmic layer {layer_idx}: {e}")
                 continue
         
-        # Merge and sort all trigger times (remove duplicates)
-        all_times = sorted(set(all_times))
-        return all_times
+        if not layer_arrays:
+            return np.empty(0)
+        
+        # Merge and sort all trigger times, deduplicating on a 1920 PPQN tick
+        # grid so float noise between layers doesn't produce near-duplicates
+        merged = np.concatenate(layer_arrays)
+        ticks = np.round(merged * self.TICKS_PER_BEAT).astype(np.int64)
+        _, first = np.unique(ticks, return_index=True)
+        return merged[first]
     
     def get_velocity(self, time: float) -> float:
         # Could vary velocity by layer, but default to 1.0
         return 1.0
     
+    def get_velocities(self, times: np.ndarray) -> np.ndarray:
+        return np.ones(len(times))
+    
+    def _cache_key(self) -> Optional[Tuple]:
+        return ('poly', tuple(tuple(sorted(layer.items())) for layer in self.layers))
+    
     def to_dict(self) -> Dict:
         return {
             'type': 'PolyrhythmicTriggerSource',
@@ -572,6 +1080,7 @@ class MicroTimingTriggerSource(TriggerSource):
         offset_range: Tuple[float, float] = (-0.1, 0.1),  # Min/max offset in beats
         offset_pattern: Optional[List[float]] = None,  # Per-step offsets for human feel
         randomize: bool = True,  # If True, use random offsets; if False, use pattern
+        seed: Optional[int] = None,
     ):
         """
         Args:
@@ -579,6 +1088,7 @@ class MicroTimingTriggerSource(TriggerSource):
             offset_range: (min, max) offset in beats
             offset_pattern: Optional list of offsets to apply cyclically
             randomize: If True, use random offsets within range; if False, use pattern
+            seed: Seed for the offset RNG (replaced by the engine's RNG when sequenced)
         """
         self.base_source = base_source
         # Validate offset_range
@@ -587,35 +1097,58 @@ class MicroTimingTriggerSource(TriggerSource):
         self.offset_range = offset_range
         self.offset_pattern = offset_pattern or []
         self.randomize = randomize
-        self._rng = random.Random()
+        self._rng_np = np.random.default_rng(seed)
+    
+    @property
+    def stochastic(self) -> bool:
+        return self.randomize or self.base_source.stochastic
+    
+    @property
+    def uses_bpm(self) -> bool:
+        return self.base_source.uses_bpm
+    
+    def set_rng(self, rng: np.random.Generator):
+        self._rng_np = rng
+        self.base_source.set_rng(rng)
     
     def get_trigger_times(self, duration_beats: float, bpm: float) -> List[float]:
-        base_times = self.base_source.get_trigger_times(duration_beats, bpm)
-        offset_times = []
+        return self.get_trigger_times_array(duration_beats, bpm).tolist()
+    
+    def get_trigger_times_array(self, duration_beats: float, bpm: float) -> np.ndarray:
+        base_times = self.base_source.get_trigger_times_array(duration_beats, bpm)
         
-        for i, time in enumerate(base_times):
-            if self.randomize:
-                # Random offset within range
-                offset = self._rng.uniform(self.offset_range[0], self.offset_range[1])
-            else:
-                # Use pattern (cyclically)
-                if self.offset_pattern:
-                    offset = self.offset_pattern[i % len(self.offset_pattern)]
-                else:
-                    offset = 0.0
-            
-            offset_time = time + offset
-            # Clamp to valid range to prevent negative times or times beyond duration
-            offset_time = max(0, min(offset_time, duration_beats - 0.001))
-            if 0 <= offset_time < duration_beats:
-                offset_times.append(offset_time)
+        if self.randomize:
+            # Random offsets within range, one batched draw
+            offsets = self._rng_np.uniform(self.offset_range[0], self.offset_range[1], base_times.size)
+        elif self.offset_pattern:
+            # Use pattern (cyclically)
+            offsets = np.resize(np.asarray(self.offset_pattern, dtype=np.float64), base_times.size)
+        else:
+            offsets = 0.0
         
-        # Remove duplicates and sort
-        return sorted(set(offset_times))
+        # Clamp to valid range to prevent negative times or times beyond duration
+        offset_times = np.maximum(0.0, np.minimum(base_times + offsets, duration_beats - 0.001))
+        offset_times = offset_times[offset_times < duration_beats]
+        
+        # Offsets smaller than half the inter-onset gap keep a sorted base in
+        # order, so the O(n) check usually spares the sort; otherwise remove
+        # duplicates and sort
+        if offset_times.size < 2 or np.all(offset_times[1:] > offset_times[:-1]):
+            return offset_times
+        return np.unique(offset_times)
     
     def get_velocity(self, time: float) -> float:
         return self.base_source.get_velocity(time)
     
+    def get_velocities(self, times: np.ndarray) -> np.ndarray:
+        return self.base_source.get_velocities(times)
+    
+    def _cache_key(self) -> Optional[Tuple]:
+        base_key = self.base_source._cache_key()
+        if base_key is None:
+            return None
+        return ('micro', base_key, tuple(self.offset_range), tuple(self.offset_pattern))
+    
     def to_dict(self) -> Dict:
         return {
             'type': 'MicroTimingTriggerSource',
@@ -645,6 +1178,8 @@ class JukePatternTriggerSource(TriggerSource):
     Predefined patterns derived from classic juke/footwork tracks.
     """
     
+    uses_bpm = False
+    
     # Classic juke/footwork patterns
     PATTERNS = {
         'juke_basic': [
@@ -712,28 +1247,33 @@ class JukePatternTriggerSource(TriggerSource):
             self.pattern = self.PATTERNS[pattern_name]
         else:
             self.pattern = self.PATTERNS['juke_basic']
+        
+        # Parallel arrays for vectorized unrolling, plus a sorted view for lookups
+        self._times = np.array([step[0] for step in self.pattern], dtype=np.float64)
+        self._vels = np.array([step[1] for step in self.pattern], dtype=np.float64)
+        self._order = np.argsort(self._times, kind='stable')
+        self._sorted_times = self._times[self._order]
     
     def get_trigger_times(self, duration_beats: float, bpm: float) -> List[float]:
-        times = []
+        return self.get_trigger_times_array(duration_beats, bpm).tolist()
+    
+    def get_trigger_times_array(self, duration_beats: float, bpm: float) -> np.ndarray:
         num_loops = int(np.ceil(duration_beats / self.loop_length))
+        if num_loops <= 0 or not self._times.size:
+            return np.empty(0)
         
-        for loop in range(num_loops):
-            for time_offset, velocity in self.pattern:
-                time = loop * self.loop_length + time_offset
-                if time < duration_beats:
-                    times.append(time)
-        
-        return sorted(times)
+        times = (np.arange(num_loops)[:, None] * self.loop_length + self._times[None, :]).ravel()
+        return np.sort(times[times < duration_beats])
     
     def get_velocity(self, time: float) -> float:
         # Find which pattern step this time corresponds to
         time_in_loop = time % self.loop_length
         
-        for time_offset, velocity in self.pattern:
-            if abs(time_in_loop - time_offset) < 0.01:
-                return velocity
-        
-        return 1.0
+        step = _first_within(self._sorted_times, self._order, time_in_loop, 0.01)
+        return float(self._vels[step]) if step is not None else 1.0
+    
+    def _cache_key(self) -> Optional[Tuple]:
+        return ('juke', tuple(tuple(step) for step in self.pattern), self.loop_length)
     
     def to_dict(self) -> Dict:
         return {
@@ -759,6 +1299,8 @@ class OffbeatTriggerSource(TriggerSource):
     Creates swing/triplet feel by offsetting triggers from the base grid.
     """
     
+    uses_bpm = False
+    
     def __init__(
         self,
         base_subdivision: float = 4.0,  # Base grid (e.g., 4.0 for 16th notes)
@@ -779,33 +1321,36 @@ class OffbeatTriggerSource(TriggerSource):
         self.pattern = pattern or [False] * 16  # Default: all on-grid
     
     def get_trigger_times(self, duration_beats: float, bpm: float) -> List[float]:
+        return self.get_trigger_times_array(duration_beats, bpm).tolist()
+    
+    def get_trigger_times_array(self, duration_beats: float, bpm: float) -> np.ndarray:
         step_duration = 1.0 / self.base_subdivision
-        times = []
-        
-        step = 0
-        time = 0.0
-        while time < duration_beats:
-            # Determine if this step should be offset
-            should_offset = self.pattern[step % len(self.pattern)] if self.pattern else False
-            
-            if should_offset:
-                # Apply swing offset
-                offset = step_duration * self.offbeat_ratio * self.swing_amount
-                trigger_time = time + offset
-            else:
-                trigger_time = time
-            
-            if 0 <= trigger_time < duration_beats:
-                times.append(trigger_time)
-            
-            time += step_duration
-            step += 1
+        num_steps = int(np.ceil(duration_beats * self.base_subdivision))
+        if num_steps <= 0:
+            return np.empty(0)
+        
+        grid = np.arange(num_steps, dtype=np.float64) * step_duration
+        grid = grid[grid < duration_beats]
+        
+        # Apply swing offset branchlessly to the steps the pattern marks
+        if self.pattern:
+            should_offset = np.resize(np.asarray(self.pattern, dtype=bool), grid.size)
+            offset = step_duration * self.offbeat_ratio * self.swing_amount
+            times = grid + should_offset * offset
+        else:
+            times = grid
         
-        return times
+        return times[(times >= 0) & (times < duration_beats)]
     
     def get_velocity(self, time: float) -> float:
         return 1.0
     
+    def get_velocities(self, times: np.ndarray) -> np.ndarray:
+        return np.ones(len(times))
+    
+    def _cache_key(self) -> Optional[Tuple]:
+        return ('offbeat', self.base_subdivision, self.offbeat_ratio, self.swing_amount, tuple(self.pattern))
+    
     def to_dict(self) -> Dict:
         return {
             'type': 'OffbeatTriggerSource',
@@ -825,6 +1370,12 @@ class OffbeatTriggerSource(TriggerSource):
         )
 
 
+# Modes whose slice is total_plays % num_slices (the source decides WHEN)
+_ORDERED_SELECT_MODES = frozenset({
+    TriggerMode.SEQUENTIAL, TriggerMode.PATTERN, TriggerMode.FOLLOW, TriggerMode.EUCLIDEAN,
+})
+
+
 class TriggerEngine:
     """
     The Autechre-style generative sequencer.
@@ -843,31 +1394,63 @@ class TriggerEngine:
         trigger_source: Optional[TriggerSource] = None,
         rules: List[TriggerRule] = None,
         seed: Optional[int] = None,
+        legacy_rng: bool = False,
     ):
-        self.mode = mode
+        """
+        Args:
+            mode: Slice selection mode
+            trigger_source: Decides WHEN triggers fire (defaults to a quarter-note grid)
+            rules: Conditional rules applied per trigger
+            seed: Seed for reproducible sequences
+            legacy_rng: Draw rule-probability and CHAOS rolls (and RANDOM /
+                PROBABILITY / CHAOS picks when there are no rules) one Python RNG call
+                at a time (pre-batching behaviour). By default these are drawn in
+                one NumPy batch per sequence, so a given seed yields a different
+                (but still reproducible) sequence than legacy mode.
+        """
         self.trigger_source = trigger_source or GridTriggerSource()
         self.rules = rules or []
         self._seed = seed
         self._rng = random.Random(seed)  # Isolated RNG instance for reproducibility
+        # Batched NumPy draws: the engine's stream for rule/CHAOS rolls and an
+        # independent child stream for the trigger source, so changing a
+        # source's parameters doesn't shift the rolls that follow it
+        seed_seq = np.random.SeedSequence(seed)
+        self._rng_np = np.random.default_rng(seed_seq)
+        self._source_rng = np.random.default_rng(seed_seq.spawn(1)[0])
+        self.legacy_rng = legacy_rng
+        self._chaos_draw = self._rng.random  # Replaced by a batched stream per sequence
         
         # State tracking for rules
-        self.state = {
-            'last_slice_index': -1,
-            'consecutive_plays': 0,
-            'total_plays': 0,
-            'play_history': [],  # Last N slice indices
-            'last_trigger_time': 0.0,
+        self.state = TriggerState()
+        
+        # Mode -> selector table (replaces an if/elif ladder)
+        self._select_dispatch = {
+            TriggerMode.SEQUENTIAL: self._select_sequential,
+            TriggerMode.RANDOM: self._select_random,
+            TriggerMode.PROBABILITY: self._select_probability,
+            TriggerMode.MIDI_MAP: self._select_midi_map,
+            TriggerMode.PATTERN: self._select_sequential,
+            TriggerMode.FOLLOW: self._select_sequential,
+            TriggerMode.EUCLIDEAN: self._select_sequential,
+            TriggerMode.CHAOS: self._select_chaos,
+            TriggerMode.FOOTWORK: self._select_footwork,
         }
+        self.mode = mode  # Binds self._selector
+    
+    @property
+    def mode(self) -> TriggerMode:
+        return self._mode
+    
+    @mode.setter
+    def mode(self, mode: TriggerMode):
+        # Resolve the selector once per mode change rather than once per trigger
+        self._mode = mode
+        self._selector = self._select_dispatch.get(mode, self._select_none)
     
     def reset_state(self):
         """Reset internal state for a new sequence"""
-        self.state = {
-            'last_slice_index': -1,
-            'consecutive_plays': 0,
-            'total_plays': 0,
-            'play_history': [],
-            'last_trigger_time': 0.0,
-        }
+        self.state.reset()
     
     def _select_slice(
         self, 
@@ -876,58 +1459,50 @@ class TriggerEngine:
         slice_bank: Optional['SliceBank'] = None,
     ) -> int:
         """Select which slice to play based on mode"""
-        
-        if self.mode == TriggerMode.SEQUENTIAL:
-            return self.state['total_plays'] % num_slices
-        
-        elif self.mode == TriggerMode.RANDOM:
+        return self._selector(num_slices, time, slice_bank)
+    
+    def _select_none(self, num_slices: int, time: float, slice_bank: Optional['SliceBank']) -> int:
+        return 0
+    
+    def _select_sequential(self, num_slices: int, time: float, slice_bank: Optional['SliceBank']) -> int:
+        # Also used by PATTERN, FOLLOW and EUCLIDEAN: the source decides WHEN,
+        # slices are stepped through in order
+        return self.state.total_plays % num_slices
+    
+    def _select_random(self, num_slices: int, time: float, slice_bank: Optional['SliceBank']) -> int:
+        return self._rng.randint(0, num_slices - 1)
+    
+    def _select_probability(self, num_slices: int, time: float, slice_bank: Optional['SliceBank']) -> int:
+        if slice_bank:
+            slice_obj = slice_bank.get_random_weighted(weight_by='energy', rng=self._rng)
+            return slice_obj.index
+        return self._rng.randint(0, num_slices - 1)
+    
+    def _select_midi_map(self, num_slices: int, time: float, slice_bank: Optional['SliceBank']) -> int:
+        if isinstance(self.trigger_source, MIDITriggerSource):
+            idx = self.trigger_source.get_slice_index(time)
+            return max(0, min(idx, num_slices - 1))
+        return 0
+    
+    def _select_chaos(self, num_slices: int, time: float, slice_bank: Optional['SliceBank']) -> int:
+        # Chaos mode: weighted random with occasional sequential runs
+        if self._chaos_draw() < 0.3:
+            # 30% chance of continuing from last slice
+            return (self.state.last_slice_index + 1) % num_slices
+        elif slice_bank:
+            return slice_bank.get_random_weighted(weight_by='transient', rng=self._rng).index
+        else:
             return self._rng.randint(0, num_slices - 1)
-        
-        elif self.mode == TriggerMode.PROBABILITY:
-            if slice_bank:
-                slice_obj = slice_bank.get_random_weighted(weight_by='energy', rng=self._rng)
-                return slice_obj.index
+    
+    def _select_footwork(self, num_slices: int, time: float, slice_bank: Optional['SliceBank']) -> int:
+        # Footwork mode: combines polyrhythmic layering with probability weighting
+        # Uses slice energy/transient strength for selection
+        if slice_bank:
+            # Weight by transient strength (footwork emphasizes rhythmic precision)
+            return slice_bank.get_random_weighted(weight_by='transient', rng=self._rng).index
+        else:
+            # Fallback to weighted random
             return self._rng.randint(0, num_slices - 1)
-        
-        elif self.mode == TriggerMode.MIDI_MAP:
-            if isinstance(self.trigger_source, MIDITriggerSource):
-                idx = self.trigger_source.get_slice_index(time)
-                return max(0, min(idx, num_slices - 1))
-            return 0
-        
-        elif self.mode == TriggerMode.PATTERN:
-            # Pattern mode uses a predefined pattern
-            # The pattern is stored in trigger_source if it's the right type
-            return self.state['total_plays'] % num_slices
-        
-        elif self.mode == TriggerMode.FOLLOW:
-            # In follow mode, slice selection can follow energy or sequential
-            return self.state['total_plays'] % num_slices
-        
-        elif self.mode == TriggerMode.EUCLIDEAN:
-            return self.state['total_plays'] % num_slices
-        
-        elif self.mode == TriggerMode.CHAOS:
-            # Chaos mode: weighted random with occasional sequential runs
-            if self._rng.random() < 0.3:
-                # 30% chance of continuing from last slice
-                return (self.state['last_slice_index'] + 1) % num_slices
-            elif slice_bank:
-                return slice_bank.get_random_weighted(weight_by='transient', rng=self._rng).index
-            else:
-                return self._rng.randint(0, num_slices - 1)
-        
-        elif self.mode == TriggerMode.FOOTWORK:
-            # Footwork mode: combines polyrhythmic layering with probability weighting
-            # Uses slice energy/transient strength for selection
-            if slice_bank:
-                # Weight by transient strength (footwork emphasizes rhythmic precision)
-                return slice_bank.get_random_weighted(weight_by='transient', rng=self._rng).index
-            else:
-                # Fallback to weighted random
-                return self._rng.randint(0, num_slices - 1)
-        
-        return 0
     
     def _evaluate_condition(self, condition: str) -> bool:
         """
@@ -939,42 +1514,23 @@ class TriggerEngine:
         - "slice_index == N"
         - "velocity > X"
         - "time_since_last > X"
-        """
-        try:
-            if "consecutive_plays" in condition:
-                parts = condition.replace("consecutive_plays", "").strip().split()
-                if len(parts) >= 2:
-                    op, value = parts[0], int(parts[1])
-                    if op == '>':
-                        return self.state['consecutive_plays'] > value
-                    elif op == '>=':
-                        return self.state['consecutive_plays'] >= value
-                    elif op == '==':
-                        return self.state['consecutive_plays'] == value
-            
-            elif "total_plays" in condition:
-                parts = condition.replace("total_plays", "").strip().split()
-                if len(parts) >= 2:
-                    op, value = parts[0], int(parts[1])
-                    if op == '>':
-                        return self.state['total_plays'] > value
-                    elif op == '%':
-                        # Modulo - fires every N plays
-                        return self.state['total_plays'] % value == 0
-            
-            elif "slice_index" in condition:
-                parts = condition.replace("slice_index", "").strip().split()
-                if len(parts) >= 2:
-                    op, value = parts[0], int(parts[1])
-                    if op == '==':
-                        return self.state['last_slice_index'] == value
-                    elif op == '!=':
-                        return self.state['last_slice_index'] != value
-            
-        except (ValueError, IndexError):
-            pass
         
-        return False
+        Conditions are compiled once per distinct string (_compile_condition);
+        generate_sequence calls the compiled predicates directly.
+        """
+        check = _compile_condition(condition)
+        return check is not None and check(self.state)
+    
+    def _compile_rules(self) -> List[_CompiledRule]:
+        """Parse enabled rules once per sequence, dropping ones that can never fire"""
+        compiled = []
+        for rule in self.rules:
+            if not rule.enabled:
+                continue
+            crule = _CompiledRule.compile(rule, len(compiled))
+            if crule is not None:
+                compiled.append(crule)
+        return compiled
     
     def _apply_action(self, action: str, event: TriggerEvent, num_slices: int) -> Tuple[TriggerEvent, bool]:
         """
@@ -982,47 +1538,39 @@ class TriggerEngine:
         
         Returns (modified_event, should_skip)
         """
-        should_skip = False
-        
-        if action == "skip_next":
-            should_skip = True
-        
-        elif action == "double_trigger":
-            # This would need to insert another event - handled at sequence level
-            pass
-        
-        elif action.startswith("pitch_up_"):
-            try:
-                semitones = int(action.replace("pitch_up_", ""))
-                event.pitch_shift += semitones
-            except ValueError:
-                pass
-        
-        elif action.startswith("pitch_down_"):
-            try:
-                semitones = int(action.replace("pitch_down_", ""))
-                event.pitch_shift -= semitones
-            except ValueError:
-                pass
-        
-        elif action == "reverse":
-            event.reverse = not event.reverse
-        
-        elif action == "random_slice":
-            event.slice_index = self._rng.randint(0, num_slices - 1)
-        
-        elif action == "reset_sequence":
-            self.reset_state()
-        
-        elif action == "half_velocity":
-            event.velocity *= 0.5
-        
-        elif action == "double_velocity":
-            event.velocity = min(1.0, event.velocity * 2)
-        
+        should_skip = _compile_action(action)(self, event, num_slices)
         event.rule_modified = True
         return event, should_skip
     
+    # Fixed-name action handlers: mutate the event, return True to skip the next trigger
+    
+    def _action_skip_next(self, event: TriggerEvent, num_slices: int) -> bool:
+        return True
+    
+    def _action_double_trigger(self, event: TriggerEvent, num_slices: int) -> bool:
+        # This would need to insert another event - handled at sequence level
+        return False
+    
+    def _action_reverse(self, event: TriggerEvent, num_slices: int) -> bool:
+        event.reverse = not event.reverse
+        return False
+    
+    def _action_random_slice(self, event: TriggerEvent, num_slices: int) -> bool:
+        event.slice_index = self._rng.randint(0, num_slices - 1)
+        return False
+    
+    def _action_reset_sequence(self, event: TriggerEvent, num_slices: int) -> bool:
+        self.reset_state()
+        return False
+    
+    def _action_half_velocity(self, event: TriggerEvent, num_slices: int) -> bool:
+        event.velocity *= 0.5
+        return False
+    
+    def _action_double_velocity(self, event: TriggerEvent, num_slices: int) -> bool:
+        event.velocity = min(1.0, event.velocity * 2)
+        return False
+    
     def generate_sequence(
         self,
         num_slices: int,
@@ -1042,87 +1590,372 @@ class TriggerEngine:
         Returns:
             List of TriggerEvents
         """
+        # Get trigger times from source (stochastic sources draw from our seeded RNG)
+        self.trigger_source.set_rng(self._source_rng)
+        trigger_times = self.trigger_source.get_trigger_times_cached(duration_beats, bpm)
+        
+        return self._sequence_from_times(trigger_times, num_slices, slice_bank)
+    
+    def generate_sequence_arrays(
+        self,
+        num_slices: int,
+        duration_beats: float,
+        bpm: float,
+        slice_bank: Optional['SliceBank'] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        generate_sequence as parallel arrays, for consumers that don't need
+        TriggerEvent objects (mixers, plotting).
+        
+        Returns:
+            Struct-of-arrays dict of times (float64), slice_indices (int32)
+            and velocities (float64), one entry per event
+        """
+        self.trigger_source.set_rng(self._source_rng)
+        trigger_times = self.trigger_source.get_trigger_times_cached(duration_beats, bpm)
+        
+        # Rule-free sequences go straight to arrays without building events
+        if num_slices > 0 and not self._compile_rules() and self._can_select_batched():
+            self.reset_state()
+            times = np.array(trigger_times, dtype=np.float64)
+            return {
+                'times': times,
+                'slice_indices': self._select_batched(trigger_times, num_slices, slice_bank).astype(np.int32),
+                'velocities': self.trigger_source.get_velocities(times).astype(np.float64, copy=False),
+            }
+        
+        return self._events_to_arrays(self._sequence_from_times(trigger_times, num_slices, slice_bank))
+    
+    @staticmethod
+    def _events_to_arrays(events: List[TriggerEvent]) -> Dict[str, np.ndarray]:
+        n = len(events)
+        return {
+            'times': np.fromiter((e.time for e in events), dtype=np.float64, count=n),
+            'slice_indices': np.fromiter((e.slice_index for e in events), dtype=np.int32, count=n),
+            'velocities': np.fromiter((e.velocity for e in events), dtype=np.float64, count=n),
+        }
+    
+    def _sequence_from_times(
+        self,
+        trigger_times: List[float],
+        num_slices: int,
+        slice_bank: Optional['SliceBank'] = None,
+    ) -> List[TriggerEvent]:
+        """Run slice selection and rules over precomputed trigger times"""
         self.reset_state()
         events = []
         
-        # Get trigger times from source
-        trigger_times = self.trigger_source.get_trigger_times(duration_beats, bpm)
+        # Rules sorted by the total_plays they need before they can fire;
+        # the active set only changes when total_plays crosses a gate
+        compiled_rules = self._compile_rules()
+        if not compiled_rules and num_slices > 0 and self._can_select_batched():
+            return self._sequence_batched(trigger_times, num_slices, slice_bank)
+        rule_gates = sorted(crule.min_total_plays for crule in compiled_rules)
+        active_cutoff = -1
+        active_rules: List[_CompiledRule] = []
+        
+        # Probability rolls: one NumPy batch per sequence unless legacy_rng
+        num_rules = len(compiled_rules)
+        roll_rule = self._rng.random  # Legacy: one seeded call per rule check
+        if self.legacy_rng:
+            rule_rolls = None
+            self._chaos_draw = self._rng.random
+        else:
+            rolls = self._rng_np.random((len(trigger_times), num_rules)) if num_rules else None
+            if rolls is not None and self._can_run_rules_jit(len(trigger_times), num_slices):
+                encoded = _encode_rules(compiled_rules)
+                if encoded is not None:
+                    return self._sequence_rules_jit(trigger_times, num_slices, rolls, encoded)
+            rule_rolls = rolls.tolist() if rolls is not None else None
+            if self.mode == TriggerMode.CHAOS:
+                self._chaos_draw = iter(self._rng_np.random(len(trigger_times)).tolist()).__next__
+        
+        # Loop-invariant lookups bound to locals once per sequence
+        select = self._selector
+        velocities = self.trigger_source.get_velocities(np.asarray(trigger_times, dtype=np.float64)).tolist()
+        triggered_by = self.mode.value
+        state = self.state
+        
+        # Footwork parameters depend only on the mode and source type
+        is_footwork = self.mode == TriggerMode.FOOTWORK
+        if is_footwork:
+            # MicroTimingTriggerSource already applies offsets in get_trigger_times,
+            # so it only gets a small additional offset for humanization
+            uniform = self._rng.uniform
+            humanize = 0.02 if isinstance(self.trigger_source, MicroTimingTriggerSource) else 0.03
+            swing = self.trigger_source.swing_amount if isinstance(self.trigger_source, OffbeatTriggerSource) else None
+            # Drum-like slices (short, hard attack) get an envelope sweep
+            is_drum = [
+                s.duration < 0.5 and s.transient_strength > 0.7
+                for s in (slice_bank.slices if slice_bank else [])
+            ]
+            num_drum_flags = len(is_drum)
         
         skip_next = False
         
-        for time in trigger_times:
+        for i, time in enumerate(trigger_times):
             if skip_next:
                 skip_next = False
                 continue
             
             # Select slice
-            slice_index = self._select_slice(num_slices, time, slice_bank)
+            slice_index = select(num_slices, time, slice_bank)
             
-            # Get velocity from source
-            velocity = self.trigger_source.get_velocity(time)
+            # Velocity from source (all looked up in one call before the loop)
+            velocity = velocities[i]
             
             # Create event
             event = TriggerEvent(
                 time=time,
                 slice_index=slice_index,
                 velocity=velocity,
-                triggered_by=self.mode.value,
+                triggered_by=triggered_by,
             )
             
             # Apply footwork-specific parameters if in FOOTWORK mode
-            if self.mode == TriggerMode.FOOTWORK:
-                # Apply micro-timing offsets if using MicroTimingTriggerSource
-                # Note: MicroTimingTriggerSource already applies offsets in get_trigger_times,
-                # but we can add a small additional random offset for humanization
-                if isinstance(self.trigger_source, MicroTimingTriggerSource):
-                    # Small additional random offset for extra humanization
-                    event.micro_offset = self._rng.uniform(-0.02, 0.02)
-                else:
-                    # Default small random offset for footwork feel
-                    event.micro_offset = self._rng.uniform(-0.03, 0.03)
+            if is_footwork:
+                # Small random offset for footwork feel
+                event.micro_offset = uniform(-humanize, humanize)
                 
                 # Apply saturation for footwork style (saturation-as-texture)
                 event.saturation_amount = 0.3 + (velocity * 0.4)  # 0.3-0.7 based on velocity
                 
                 # Apply swing if using OffbeatTriggerSource
-                if isinstance(self.trigger_source, OffbeatTriggerSource):
-                    event.swing_amount = self.trigger_source.swing_amount
+                if swing is not None:
+                    event.swing_amount = swing
                 
                 # Apply envelope sweep for drum-like slices (if slice_bank available)
-                if slice_bank and slice_index < len(slice_bank.slices):
-                    slice_obj = slice_bank.slices[slice_index]
-                    # If it's a drum slice (short duration, high transient), add envelope sweep
-                    if slice_obj.duration < 0.5 and slice_obj.transient_strength > 0.7:
-                        event.envelope_sweep = 0.5 + (velocity * 0.3)  # 0.5-0.8
+                if slice_index < num_drum_flags and is_drum[slice_index]:
+                    event.envelope_sweep = 0.5 + (velocity * 0.3)  # 0.5-0.8
             
             # Update state for rule evaluation
-            if slice_index == self.state['last_slice_index']:
-                self.state['consecutive_plays'] += 1
+            if slice_index == state.last_slice_index:
+                state.consecutive_plays += 1
             else:
-                self.state['consecutive_plays'] = 1
+                state.consecutive_plays = 1
             
-            self.state['last_slice_index'] = slice_index
-            self.state['total_plays'] += 1
-            self.state['play_history'].append(slice_index)
-            if len(self.state['play_history']) > 16:
-                self.state['play_history'].pop(0)
+            state.last_slice_index = slice_index
+            state.total_plays += 1
+            state.play_history.append(slice_index)  # deque drops the oldest itself
             
-            # Apply rules
-            for rule in self.rules:
-                if not rule.enabled:
-                    continue
+            # Apply rules (in their original order, minus ones gated out)
+            if compiled_rules:
+                cutoff = bisect_right(rule_gates, state.total_plays)
+                if cutoff != active_cutoff:
+                    active_cutoff = cutoff
+                    total_plays = state.total_plays
+                    active_rules = [c for c in compiled_rules if c.min_total_plays <= total_plays]
+                    min_consecutive = min((c.min_consecutive for c in active_rules), default=0)
                 
-                if self._evaluate_condition(rule.condition):
-                    if random.random() < rule.probability:
-                        event, should_skip = self._apply_action(rule.action, event, num_slices)
-                        if should_skip:
-                            skip_next = True
+                # Skip the whole rule pass when the current run is too short for any of them
+                if state.consecutive_plays >= min_consecutive:
+                    for crule in active_rules:
+                        if state.consecutive_plays < crule.min_consecutive:
+                            continue
+                        
+                        if crule.check(state):
+                            roll = roll_rule() if rule_rolls is None else rule_rolls[i][crule.position]
+                            if roll < crule.rule.probability:
+                                if crule.act(self, event, num_slices):
+                                    skip_next = True
+                                event.rule_modified = True
             
             events.append(event)
-            self.state['last_trigger_time'] = time
+            state.last_trigger_time = time
+        
+        self._chaos_draw = self._rng.random
+        return events
+    
+    def _can_run_rules_jit(self, num_events: int, num_slices: int) -> bool:
+        """True when the rule loop can run in the compiled kernel"""
+        return (
+            _HAS_NUMBA
+            and self.mode in _ORDERED_SELECT_MODES
+            and num_slices > 0
+            and num_events >= _RULES_JIT_MIN_EVENTS
+        )
+    
+    def _sequence_rules_jit(
+        self,
+        trigger_times: List[float],
+        num_slices: int,
+        rolls: np.ndarray,
+        encoded: Tuple[np.ndarray, ...],
+    ) -> List[TriggerEvent]:
+        """Run _run_rules_jit and unpack its arrays into events and engine state"""
+        times = np.asarray(trigger_times, dtype=np.float64)
+        (
+            source, slices, velocities, pitches, reverses, modified,
+            count, last, consecutive, total, last_time, history_start,
+        ) = _run_rules_jit(
+            times,
+            self.trigger_source.get_velocities(times).astype(np.float64, copy=False),
+            num_slices,
+            rolls,
+            *encoded,
+        )
         
+        slices = slices[:count].tolist()
+        triggered_by = self.mode.value
+        events = [
+            TriggerEvent(
+                time=trigger_times[i],
+                slice_index=slice_index,
+                velocity=velocity,
+                triggered_by=triggered_by,
+                pitch_shift=pitch,
+                reverse=reverse,
+                rule_modified=rule_modified,
+            )
+            for i, slice_index, velocity, pitch, reverse, rule_modified in zip(
+                source[:count].tolist(), slices, velocities[:count].tolist(),
+                pitches[:count].tolist(), reverses[:count].tolist(), modified[:count].tolist(),
+            )
+        ]
+        
+        state = self.state
+        state.last_slice_index = int(last)
+        state.consecutive_plays = int(consecutive)
+        state.total_plays = int(total)
+        state.last_trigger_time = float(last_time)
+        state.play_history.extend(slices[max(history_start, count - PLAY_HISTORY_LENGTH):])
         return events
     
+    def _can_select_batched(self) -> bool:
+        """True when every slice choice is independent of the previous events"""
+        if self.mode in _ORDERED_SELECT_MODES:
+            return True
+        # Seeded random picks are batched only off the legacy per-call RNG
+        return not self.legacy_rng and self.mode in (TriggerMode.RANDOM, TriggerMode.PROBABILITY, TriggerMode.CHAOS)
+    
+    def _random_picks(self, n: int, num_slices: int, slice_bank: Optional['SliceBank'], weight_by: str) -> np.ndarray:
+        """n independent picks: weighted from the bank (as get_random_weighted) or uniform"""
+        if not slice_bank:
+            return self._rng_np.integers(0, num_slices, n)
+        # Same weights and "first cumsum >= r" rule as get_random_weighted
+        cumulative = slice_bank.cumulative_weights(weight_by)
+        picks = np.minimum(np.searchsorted(cumulative, self._rng_np.random(n)), cumulative.size - 1)
+        return np.array([s.index for s in slice_bank.slices])[picks]
+    
+    def _select_batched(
+        self,
+        trigger_times: List[float],
+        num_slices: int,
+        slice_bank: Optional['SliceBank'] = None,
+    ) -> np.ndarray:
+        """
+        Rule-free fast path: pick every slice index in one NumPy call.
+        
+        Leaves self.state as the per-event loop would.
+        """
+        n = len(trigger_times)
+        if self.mode in _ORDERED_SELECT_MODES:
+            slice_indices = np.arange(n) % num_slices
+        elif self.mode == TriggerMode.CHAOS:
+            # 30% of events continue from the previous slice, the rest are fresh
+            # transient-weighted picks. A run of continuations counts up from the
+            # latest fresh pick before it (from -1 if there is none yet).
+            follow = self._rng_np.random(n) < 0.3
+            fresh = self._random_picks(n, num_slices, slice_bank, 'transient')
+            steps = np.arange(n)
+            anchor = np.maximum.accumulate(np.where(follow, -1, steps))
+            base = np.where(anchor >= 0, fresh[np.maximum(anchor, 0)], -1)
+            slice_indices = np.where(follow, (base + steps - anchor) % num_slices, fresh)
+        elif self.mode == TriggerMode.PROBABILITY:
+            slice_indices = self._random_picks(n, num_slices, slice_bank, 'energy')
+        else:
+            slice_indices = self._rng_np.integers(0, num_slices, n)
+        
+        if n:
+            state = self.state
+            last = slice_indices[-1]
+            # Length of the trailing run of the final slice
+            changes = np.flatnonzero(slice_indices != last)
+            state.last_slice_index = int(last)
+            state.consecutive_plays = int(n - 1 - changes[-1]) if changes.size else n
+            state.total_plays = n
+            state.play_history.extend(slice_indices[-PLAY_HISTORY_LENGTH:].tolist())
+            state.last_trigger_time = trigger_times[-1]
+        
+        return slice_indices
+    
+    def _sequence_batched(
+        self,
+        trigger_times: List[float],
+        num_slices: int,
+        slice_bank: Optional['SliceBank'] = None,
+    ) -> List[TriggerEvent]:
+        """_select_batched, wrapped into TriggerEvents"""
+        slice_indices = self._select_batched(trigger_times, num_slices, slice_bank).tolist()
+        velocities = self.trigger_source.get_velocities(np.asarray(trigger_times, dtype=np.float64)).tolist()
+        triggered_by = self.mode.value
+        return [
+            TriggerEvent(time=time, slice_index=slice_index, velocity=velocity, triggered_by=triggered_by)
+            for time, slice_index, velocity in zip(trigger_times, slice_indices, velocities)
+        ]
+    
+    def generate_sequences_batch(
+        self,
+        seeds: List[int],
+        num_slices: int,
+        duration_beats: float,
+        bpm: float,
+        slice_bank: Optional['SliceBank'] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Generate one candidate sequence per seed (A/B audition, UI scrubbing).
+        
+        Trigger times are seed-independent for deterministic sources, so they
+        are computed once and shared by every lane; only slice selection and
+        rule evaluation run per seed. Each lane matches what
+        TriggerEngine(..., seed=seed).generate_sequence() would return.
+        
+        Returns:
+            Struct-of-arrays dict:
+            - times, velocities: float64 (B, T)
+            - slice_indices: int32 (B, T), -1 where a lane is shorter than T
+            - lengths: int32 (B,) number of events per lane
+        """
+        shared_times = None
+        if not self.trigger_source.stochastic:
+            shared_times = self.trigger_source.get_trigger_times_cached(duration_beats, bpm)
+        
+        lanes = []
+        for seed in seeds:
+            lane = TriggerEngine(
+                mode=self.mode,
+                trigger_source=self.trigger_source,
+                rules=self.rules,
+                seed=int(seed),
+                legacy_rng=self.legacy_rng,
+            )
+            if shared_times is None:
+                lanes.append(lane.generate_sequence(num_slices, duration_beats, bpm, slice_bank))
+            else:
+                lanes.append(lane._sequence_from_times(shared_times, num_slices, slice_bank))
+        
+        num_lanes = len(lanes)
+        max_len = max((len(events) for events in lanes), default=0)
+        times = np.zeros((num_lanes, max_len), dtype=np.float64)
+        velocities = np.zeros((num_lanes, max_len), dtype=np.float64)
+        slice_indices = np.full((num_lanes, max_len), -1, dtype=np.int32)
+        lengths = np.zeros(num_lanes, dtype=np.int32)
+        
+        for b, events in enumerate(lanes):
+            n = len(events)
+            lengths[b] = n
+            lane_arrays = self._events_to_arrays(events)
+            times[b, :n] = lane_arrays['times']
+            velocities[b, :n] = lane_arrays['velocities']
+            slice_indices[b, :n] = lane_arrays['slice_indices']
+        
+        return {
+            'times': times,
+            'slice_indices': slice_indices,
+            'velocities': velocities,
+            'lengths': lengths,
+        }
+    
     def to_dict(self) -> Dict:
         return {
             'mode': self.mode.value,
@@ -1139,32 +1972,38 @@ class TriggerEngine:
         return cls(mode=mode, trigger_source=trigger_source, rules=rules)
 
 
-# Preset configurations
+# Preset configurations: mode plus factories for a fresh trigger source and rule list.
+# trigger_source_class names the factory's product without building it.
 TRIGGER_PRESETS = {
     'linear': {
         'mode': TriggerMode.SEQUENTIAL,
-        'trigger_source': GridTriggerSource(subdivision=1.0),
-        'rules': [],
+        'trigger_source_class': GridTriggerSource,
+        'trigger_source_factory': lambda: GridTriggerSource(subdivision=1.0),
+        'rules_factory': list,
     },
     'sixteenth_notes': {
         'mode': TriggerMode.SEQUENTIAL,
-        'trigger_source': GridTriggerSource(subdivision=4.0),
-        'rules': [],
+        'trigger_source_class': GridTriggerSource,
+        'trigger_source_factory': lambda: GridTriggerSource(subdivision=4.0),
+        'rules_factory': list,
     },
     'euclidean_5_8': {
         'mode': TriggerMode.EUCLIDEAN,
-        'trigger_source': EuclideanTriggerSource(hits=5, steps=8),
-        'rules': [],
+        'trigger_source_class': EuclideanTriggerSource,
+        'trigger_source_factory': lambda: EuclideanTriggerSource(hits=5, steps=8),
+        'rules_factory': list,
     },
     'euclidean_7_16': {
         'mode': TriggerMode.EUCLIDEAN,
-        'trigger_source': EuclideanTriggerSource(hits=7, steps=16),
-        'rules': [],
+        'trigger_source_class': EuclideanTriggerSource,
+        'trigger_source_factory': lambda: EuclideanTriggerSource(hits=7, steps=16),
+        'rules_factory': list,
     },
     'autechre_basic': {
         'mode': TriggerMode.CHAOS,
-        'trigger_source': EuclideanTriggerSource(hits=5, steps=8),
-        'rules': [
+        'trigger_source_class': EuclideanTriggerSource,
+        'trigger_source_factory': lambda: EuclideanTriggerSource(hits=5, steps=8),
+        'rules_factory': lambda: [
             TriggerRule(
                 id='skip_triple',
                 name='Skip after triple',
@@ -1183,12 +2022,13 @@ TRIGGER_PRESETS = {
     },
     'autechre_glitch': {
         'mode': TriggerMode.CHAOS,
-        'trigger_source': ProbabilityTriggerSource(
+        'trigger_source_class': ProbabilityTriggerSource,
+        'trigger_source_factory': lambda: ProbabilityTriggerSource(
             steps=16,
             probabilities=[1, 0.5, 0.8, 0.3, 1, 0.5, 0.7, 0.2, 1, 0.4, 0.9, 0.3, 1, 0.6, 0.8, 0.4],
             subdivision=4.0,
         ),
-        'rules': [
+        'rules_factory': lambda: [
             TriggerRule(
                 id='pitch_streak',
                 name='Pitch up on streak',
@@ -1208,36 +2048,40 @@ TRIGGER_PRESETS = {
     # Footwork presets
     'footwork_basic': {
         'mode': TriggerMode.FOOTWORK,
-        'trigger_source': PolyrhythmicTriggerSource(
+        'trigger_source_class': PolyrhythmicTriggerSource,
+        'trigger_source_factory': lambda: PolyrhythmicTriggerSource(
             layers=[
                 {'hits': 4, 'steps': 4, 'subdivision': 1.0, 'offset': 0.0},  # Kick on 4/4
                 {'hits': 3, 'steps': 4, 'subdivision': 1.0, 'offset': 0.0},  # Snare on 3/4
                 {'hits': 5, 'steps': 8, 'subdivision': 2.0, 'offset': 0.0},  # Hats on 5/8
             ]
         ),
-        'rules': [],
+        'rules_factory': list,
     },
     'juke_pattern': {
         'mode': TriggerMode.FOOTWORK,
-        'trigger_source': JukePatternTriggerSource(
+        'trigger_source_class': JukePatternTriggerSource,
+        'trigger_source_factory': lambda: JukePatternTriggerSource(
             pattern_name='juke_basic',
             loop_length=4.0,
         ),
-        'rules': [],
+        'rules_factory': list,
     },
     'ghetto_house': {
         'mode': TriggerMode.FOOTWORK,
-        'trigger_source': OffbeatTriggerSource(
+        'trigger_source_class': OffbeatTriggerSource,
+        'trigger_source_factory': lambda: OffbeatTriggerSource(
             base_subdivision=4.0,
             offbeat_ratio=1.0 / 3.0,
             swing_amount=0.6,
             pattern=[False, True, False, True, False, True, False, True] * 2,  # Every other step offset
         ),
-        'rules': [],
+        'rules_factory': list,
     },
     'footwork_poly': {
         'mode': TriggerMode.FOOTWORK,
-        'trigger_source': PolyrhythmicTriggerSource(
+        'trigger_source_class': PolyrhythmicTriggerSource,
+        'trigger_source_factory': lambda: PolyrhythmicTriggerSource(
             layers=[
                 {'hits': 4, 'steps': 4, 'subdivision': 1.0, 'offset': 0.0},    # Kick
                 {'hits': 3, 'steps': 4, 'subdivision': 1.0, 'offset': 0.5},    # Snare offset
@@ -1245,16 +2089,23 @@ TRIGGER_PRESETS = {
                 {'hits': 7, 'steps': 12, 'subdivision': 3.0, 'offset': 0.0},  # Extra layer
             ]
         ),
-        'rules': [],
+        'rules_factory': list,
     },
 }
 
 
-def create_trigger_engine(preset: str = 'linear') -> TriggerEngine:
-    """Create a TriggerEngine from a preset name"""
+def create_trigger_engine(preset: str = 'linear', seed: Optional[int] = None) -> TriggerEngine:
+    """
+    Create a TriggerEngine from a preset name.
+    
+    Every engine gets its own source and rules from the preset factories,
+    so per-engine state (set_rng, rule edits) never leaks between callers.
+    Unknown names fall back to 'linear'.
+    """
     config = TRIGGER_PRESETS.get(preset, TRIGGER_PRESETS['linear'])
     return TriggerEngine(
         mode=config['mode'],
-        trigger_source=config['trigger_source'],
-        rules=config.get('rules', []),
+        trigger_source=config['trigger_source_factory'](),
+        rules=config['rules_factory'](),
+        seed=seed,
     )
@@ -19,35 +19,128 @@ import numpy as np
 import subprocess
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import cached_property, partial
+from collections import Counter
+import multiprocessing
+import atexit
+import logging
+import os
 import json
 import librosa
 
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:  # Optional: the NumPy normalize is used without it
+    _HAS_NUMBA = False
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:  # Optional: stdlib json is used without it
+    _HAS_ORJSON = False
+
 from .key_detector import KeyDetector, KeyResult
 from .pitch_engine import PitchEngine, PitchContour
 from .artifact_engine import ArtifactEngine, ArtifactPreset
 from .tagging_engine import TaggingEngine
 
 
+logger = logging.getLogger(__name__)
+
+_PIPE_BUFSIZE = 1 << 20
+
+# Upper bound on batch worker processes. Each one holds its own torch
+# engines, so this (not core count) is what bounds a batch's memory.
+_MAX_POOL_WORKERS = int(os.getenv("LOOPFORGE_FORGE_MAX_WORKERS", "4"))
+
+_CHROMATIC_SCALE = tuple(range(12))
+
+
+def _probe_audio(path: Path) -> tuple[int, float]:
+    """Return (native sample rate, duration in seconds) via ffprobe."""
+    cmd = [
+        'ffprobe', '-v', 'error',
+        '-select_streams', 'a:0',
+        '-show_entries', 'stream=sample_rate:format=duration',
+        '-of', 'json',
+        str(path)
+    ]
+    info = json.loads(subprocess.run(cmd, capture_output=True, check=True).stdout)
+    native_sr = int(info['streams'][0]['sample_rate'])
+    duration = float(info.get('format', {}).get('duration') or 0.0)
+    return native_sr, duration
+
+
+def _load_audio_ffmpeg(path: Path, sr: Optional[int] = None) -> tuple[np.ndarray, int]:
+    """
+    Decode to mono float32 by streaming ffmpeg stdout into one buffer.
+    
+    The output is sized from ffprobe's duration up front, so the samples
+    are read straight into their final array with no intermediate bytes
+    object or copy. Falls back to librosa when ffmpeg isn't installed.
+    
+    Returns:
+        (audio, sample_rate); sample_rate is the native rate when sr is None
+    """
+    try:
+        native_sr, duration = _probe_audio(path)
+    except FileNotFoundError:
+        return librosa.load(str(path), sr=sr, mono=True)
+    
+    out_sr = sr or native_sr
+    cmd = [
+        'ffmpeg', '-v', 'error',
+        '-i', str(path),
+        '-f', 'f32le',
+        '-ac', '1',
+        '-ar', str(out_sr),
+        'pipe:1'
+    ]
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        bufsize=_PIPE_BUFSIZE
+    )
+    
+    # A little headroom for container durations that round down
+    audio = np.empty(int(duration * out_sr) + out_sr, dtype=np.float32)
+    view = memoryview(audio).cast('B')
+    filled = 0
+    while filled < len(view):
+        n = process.stdout.readinto(view[filled:])
+        if not n:
+            break
+        filled += n
+    
+    # Duration was wrong (or missing): append whatever is left
+    tail = process.stdout.read() if filled == len(view) else b''
+    process.stdout.close()
+    if process.wait() != 0:
+        raise RuntimeError(f"ffmpeg failed to decode {path}")
+    
+    audio = audio[:filled // 4]
+    if tail:
+        audio = np.concatenate([audio, np.frombuffer(tail, dtype=np.float32)])
+    return audio, out_sr
+
+
 def _save_audio_ffmpeg(path: Path, audio: np.ndarray, sr: int):
-    """Save audio using ffmpeg pipe (no soundfile dependency)."""
-    # Ensure mono or get channels
-    if audio.ndim == 1:
-        channels = 1
-        audio_data = audio.astype(np.float32)
-    else:
-        channels = audio.shape[0] if audio.shape[0] < audio.shape[1] else audio.shape[1]
-        if audio.shape[0] > audio.shape[1]:
-            audio_data = audio.T.astype(np.float32)
-        else:
-            audio_data = audio.astype(np.float32)
-    
-    # Reshape for ffmpeg [samples, channels]
-    if audio_data.ndim == 1:
-        audio_data = audio_data.reshape(-1, 1)
-    elif audio_data.shape[0] == channels:
-        audio_data = audio_data.T
+    """
+    Save audio using ffmpeg pipe (no soundfile dependency).
+    
+    audio is mono [samples] or interleaved [samples, channels]. Callers
+    own the layout: nothing is transposed here, and a C-contiguous
+    float32 buffer is written without any copy.
+    """
+    if audio.ndim not in (1, 2):
+        raise ValueError(f"Expected [samples] or [samples, channels], got shape {audio.shape}")
+    channels = 1 if audio.ndim == 1 else audio.shape[1]
+    audio_data = np.ascontiguousarray(audio, dtype=np.float32)
     
     cmd = [
         'ffmpeg', '-y',
@@ -55,17 +148,61 @@ def _save_audio_ffmpeg(path: Path, audio: np.ndarray, sr: int):
         '-ar', str(sr),
         '-ac', str(channels),
         '-i', '-',
-        '-acodec', 'pcm_f32le',
-        str(path)
     ]
+    # Non-wav outputs let ffmpeg pick the container's default codec
+    if path.suffix.lower() == '.wav':
+        cmd += ['-acodec', 'pcm_f32le']
+    cmd.append(str(path))
     
     process = subprocess.Popen(
         cmd,
         stdin=subprocess.PIPE,
         stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL
+        stderr=subprocess.DEVNULL,
+        bufsize=_PIPE_BUFSIZE
     )
-    process.communicate(input=audio_data.tobytes())
+    # Written straight from the array's buffer, no bytes copy
+    process.communicate(input=memoryview(audio_data).cast('B'))
+    if process.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to write {path}")
+
+
+# Buffers at least this long use the parallel JIT kernel (~1.5 s at 44.1 kHz)
+_PEAK_NORM_JIT_MIN_SAMPLES = 1 << 16
+
+if _HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _peak_normalize_jit(audio: np.ndarray, target: float) -> None:
+        """Abs-max scan and in-place scale without an np.abs temporary"""
+        peak = 0.0
+        for i in prange(audio.size):
+            peak = max(peak, abs(audio[i]))
+        if peak > 0.0:
+            scale = target / peak
+            for i in prange(audio.size):
+                audio[i] *= scale
+
+
+def _peak_normalize(audio: np.ndarray, target: float) -> None:
+    """Scale a float32 buffer in place so its peak is `target`."""
+    if _HAS_NUMBA and audio.ndim == 1 and audio.size >= _PEAK_NORM_JIT_MIN_SAMPLES:
+        _peak_normalize_jit(audio, target)
+        return
+    peak = float(np.max(np.abs(audio))) if audio.size else 0.0
+    if peak > 0:
+        np.multiply(audio, target / peak, out=audio)
+
+
+def _fused_normalize_and_write(path: Path, audio: np.ndarray, sr: int, target: float = 0.95):
+    """
+    Peak-normalize in place and pipe the float32 samples to ffmpeg.
+    
+    Scales by a precomputed reciprocal into the existing buffer, so the
+    only full-length pass besides the peak scan is the write itself.
+    """
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
+    _peak_normalize(audio, target)
+    _save_audio_ffmpeg(path, audio, sr)
 
 
 @dataclass
@@ -87,6 +224,21 @@ class TrackAnalysis:
     error: Optional[str] = None
     tags: list[str] = field(default_factory=list)
     
+    @classmethod
+    def failed(cls, filepath: Path, error: str) -> 'TrackAnalysis':
+        return cls(
+            filename=filepath.name,
+            filepath=filepath,
+            duration_seconds=0,
+            sample_rate=0,
+            key='unknown',
+            mode='unknown',
+            key_confidence=0,
+            bpm=None,
+            status='error',
+            error=error
+        )
+    
     def to_dict(self) -> dict:
         return {
             'filename': self.filename,
@@ -135,6 +287,10 @@ class ProcessingConfig:
             'output_format': self.output_format,
             'output_sr': self.output_sr
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ProcessingConfig':
+        return cls(**data)
 
 
 @dataclass
@@ -149,6 +305,19 @@ class ProcessingResult:
     status: str
     error: Optional[str] = None
     
+    @classmethod
+    def failed(cls, filepath: Path, error: str, processing_time_seconds: float = 0) -> 'ProcessingResult':
+        return cls(
+            filename=filepath.name,
+            input_path=filepath,
+            output_path=None,
+            original_key='unknown',
+            target_key='unknown',
+            processing_time_seconds=processing_time_seconds,
+            status='error',
+            error=error
+        )
+    
     def to_dict(self) -> dict:
         return {
             'filename': self.filename,
@@ -161,6 +330,73 @@ class ProcessingResult:
         }
 
 
+def _path_key(path: Path) -> str:
+    """Normalized lookup key for matching analyses to input files."""
+    return Path(path).resolve().as_posix()
+
+
+# Per-process VocalForge used by the batch workers. Its engines load on
+# first use, so a worker only holds the models its tasks actually touch.
+_WORKER_FORGE: Optional['VocalForge'] = None
+_WORKER_SETTINGS: Optional[dict] = None
+
+
+def _get_worker_forge(settings: dict) -> 'VocalForge':
+    """settings are the parent's VocalForge._worker_settings() kwargs."""
+    global _WORKER_FORGE, _WORKER_SETTINGS
+    if _WORKER_FORGE is None or _WORKER_SETTINGS != settings:
+        _WORKER_FORGE = VocalForge(max_workers=1, **settings)
+        _WORKER_SETTINGS = settings
+    return _WORKER_FORGE
+
+
+def _warm_worker(settings: dict) -> None:
+    """
+    Pool initializer: one torch thread per process.
+    
+    With LOOPFORGE_FORGE_PRELOAD_ENGINES=1 every engine (CLAP included) is
+    also built up front in each worker, trading pool-size x model memory
+    for no first-task latency. Independent of main.py's
+    LOOPFORGE_PRELOAD_MODELS, which only preloads Demucs at app startup.
+    """
+    import torch
+    
+    # The pool already runs several processes; don't let each one
+    # spin up a full intra-op thread pool on top of that
+    torch.set_num_threads(1)
+    if os.environ.get("LOOPFORGE_FORGE_PRELOAD_ENGINES") != "1":
+        return
+    try:
+        forge = _get_worker_forge(settings)
+        for engine in ('key_detector', 'pitch_engine', 'artifact_engine', 'tagging_engine'):
+            getattr(forge, engine)
+    except Exception as e:
+        # A failing initializer breaks the whole pool; let each task retry
+        # and report its own error instead
+        logger.warning("Worker warm-up failed: %s", e)
+
+
+def _worker_analyze(path_str: str, settings: dict) -> 'TrackAnalysis':
+    """Analyze one track (runs in ProcessPoolExecutor)."""
+    return _get_worker_forge(settings).analyze_track(Path(path_str))
+
+
+def _worker_process(
+    path_str: str,
+    analysis: Optional['TrackAnalysis'],
+    output_dir_str: str,
+    config_dict: dict,
+    settings: dict
+) -> 'ProcessingResult':
+    """Process one track (runs in ProcessPoolExecutor)."""
+    return _get_worker_forge(settings).process_track(
+        Path(path_str),
+        Path(output_dir_str),
+        ProcessingConfig.from_dict(config_dict),
+        analysis
+    )
+
+
 class VocalForge:
     """
     Main orchestrator for professional vocal processing.
@@ -188,23 +424,46 @@ class VocalForge:
     def __init__(
         self,
         max_workers: int = 4,
-        default_sr: int = 44100
+        default_sr: int = 44100,
+        min_tag_duration_seconds: float = 4.0
     ):
         """
         Initialize VocalForge.
         
         Args:
-            max_workers: Max parallel processing threads
+            max_workers: Worker processes in the shared batch pool (capped
+                at LOOPFORGE_FORGE_MAX_WORKERS, default 4)
             default_sr: Default sample rate for processing
+            min_tag_duration_seconds: Shorter clips skip CLAP tagging (tags on
+                one-bar loops are mostly noise and cost a full inference)
         """
         self.max_workers = max_workers
         self.default_sr = default_sr
+        self.min_tag_duration_seconds = min_tag_duration_seconds
         
-        # Initialize engines
-        self.key_detector = KeyDetector()
-        self.pitch_engine = PitchEngine()
-        self.artifact_engine = ArtifactEngine(sr=default_sr)
-        self.tagging_engine = TaggingEngine()
+        # Batch worker pool, created on first batch and kept warm across
+        # calls so per-process engines are only built once (see close())
+        self._pool: Optional[ProcessPoolExecutor] = None
+        
+    # Engines are built on first use: analysis needs the key detector and
+    # tagger (CLAP), processing the pitch and artifact engines. Batch
+    # workers build their own per process.
+    
+    @cached_property
+    def key_detector(self) -> KeyDetector:
+        return KeyDetector()
+    
+    @cached_property
+    def pitch_engine(self) -> PitchEngine:
+        return PitchEngine()
+    
+    @cached_property
+    def artifact_engine(self) -> ArtifactEngine:
+        return ArtifactEngine(sr=self.default_sr)
+    
+    @cached_property
+    def tagging_engine(self) -> TaggingEngine:
+        return TaggingEngine()
     
     # =========================================================================
     # ANALYSIS
@@ -222,7 +481,7 @@ class VocalForge:
         """
         try:
             # Load audio
-            audio, sr = librosa.load(str(filepath), sr=None, mono=True)
+            audio, sr = _load_audio_ffmpeg(filepath)
             duration = len(audio) / sr
             
             # Detect key
@@ -230,7 +489,7 @@ class VocalForge:
             
             # Detect tags
             tags = []
-            if self.tagging_engine:
+            if duration >= self.min_tag_duration_seconds and self.tagging_engine:
                 tag_results = self.tagging_engine.predict_tags(str(filepath), top_k=3)
                 tags = [r['tag'] for r in tag_results]
             
@@ -248,18 +507,7 @@ class VocalForge:
             )
             
         except Exception as e:
-            return TrackAnalysis(
-                filename=filepath.name,
-                filepath=filepath,
-                duration_seconds=0,
-                sample_rate=0,
-                key='unknown',
-                mode='unknown',
-                key_confidence=0,
-                bpm=None,
-                status='error',
-                error=str(e)
-            )
+            return TrackAnalysis.failed(filepath, str(e))
     
     def analyze_batch(
         self,
@@ -276,41 +524,15 @@ class VocalForge:
         Returns:
             List of TrackAnalysis results
         """
-        results = []
-        total = len(filepaths)
+        # Separate processes so the Python glue between librosa/numpy
+        # calls isn't serialized by the GIL
+        worker = partial(_worker_analyze, settings=self._worker_settings())
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self.analyze_track, fp): fp 
-                for fp in filepaths
-            }
-            
-            completed = 0
-            for future in as_completed(futures):
-                filepath = futures[future]
-                completed += 1
-                
-                if progress_callback:
-                    progress_callback(completed, total, filepath.name)
-                
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    results.append(TrackAnalysis(
-                        filename=filepath.name,
-                        filepath=filepath,
-                        duration_seconds=0,
-                        sample_rate=0,
-                        key='unknown',
-                        mode='unknown',
-                        key_confidence=0,
-                        bpm=None,
-                        status='error',
-                        error=str(e)
-                    ))
+        progress = None
+        if progress_callback:
+            progress = lambda done, total, fp, result: progress_callback(done, total, fp.name)
         
-        return results
+        return self._execute_batch(worker, filepaths, failed=TrackAnalysis.failed, progress=progress)
     
     # =========================================================================
     # PROCESSING
@@ -339,25 +561,22 @@ class VocalForge:
         start_time = time.perf_counter()
         
         try:
-            # Load audio using GPU-accelerated loader
-            from app.engines.torch_utils import load_audio, save_audio
-            import torch
+            # Engines work on mono numpy; ffmpeg downmixes and resamples
+            audio, _ = _load_audio_ffmpeg(filepath, sr=config.output_sr)
             
-            # Load to GPU tensor
-            audio_tensor = load_audio(str(filepath), sr=config.output_sr)
-            
-            # Convert to numpy for current engine compatibility
-            # (Future: Update engines to support tensors directly)
-            audio = audio_tensor.cpu().numpy()
-            if audio.ndim == 2:
-                audio = audio.mean(axis=0) # Convert to mono for processing
-            
-            # Get or compute analysis
+            # Get or compute analysis; with an explicit target key the
+            # original is only reported, so don't pay for a second analysis
             if original_analysis:
                 original_key = f"{original_analysis.key} {original_analysis.mode}"
+            elif config.target_key and config.target_mode:
+                original_key = 'unknown'
             else:
-                analysis = self.analyze_track(filepath)
-                original_key = f"{analysis.key} {analysis.mode}"
+                # Key only: a full analyze_track would also load the tagger
+                try:
+                    key_result = self.key_detector.detect_key(audio, config.output_sr, estimate_bpm=False)
+                    original_key = f"{key_result.key} {key_result.mode}"
+                except Exception:
+                    original_key = 'unknown'
             
             # Determine target key
             if config.target_key and config.target_mode:
@@ -375,7 +594,7 @@ class VocalForge:
                         original_analysis.mode
                     )
                 else:
-                    target_scale = list(range(12))  # All notes
+                    target_scale = _CHROMATIC_SCALE  # All notes
             
             # Apply pitch correction
             if config.correction_strength > 0:
@@ -412,23 +631,13 @@ class VocalForge:
                 )
                 audio = self.artifact_engine.apply_full_chain(audio, config.output_sr, preset)
             
-            # Normalize output
-            peak = np.max(np.abs(audio))
-            if peak > 0:
-                audio = audio / peak * 0.95
-            
-            # Save output
+            # Normalize and save output
             output_dir.mkdir(parents=True, exist_ok=True)
             stem = filepath.stem
             output_filename = f"{stem}_processed.{config.output_format}"
             output_path = output_dir / output_filename
             
-            # Convert back to tensor for saving
-            out_tensor = torch.from_numpy(audio).float()
-            if out_tensor.ndim == 1:
-                out_tensor = out_tensor.unsqueeze(0)
-                
-            save_audio(str(output_path), out_tensor, config.output_sr)
+            _fused_normalize_and_write(output_path, audio, config.output_sr)
             
             processing_time = time.perf_counter() - start_time
             
@@ -444,16 +653,7 @@ class VocalForge:
             
         except Exception as e:
             processing_time = time.perf_counter() - start_time
-            return ProcessingResult(
-                filename=filepath.name,
-                input_path=filepath,
-                output_path=None,
-                original_key='unknown',
-                target_key='unknown',
-                processing_time_seconds=processing_time,
-                status='error',
-                error=str(e)
-            )
+            return ProcessingResult.failed(filepath, str(e), processing_time)
     
     def process_batch(
         self,
@@ -476,67 +676,139 @@ class VocalForge:
         Returns:
             List of ProcessingResult
         """
-        results = []
-        total = len(filepaths)
-        
-        # Build analysis lookup
+        # Build analysis lookup (resolved, so relative/absolute paths match)
         analysis_map = {}
         if analyses:
             for analysis in analyses:
-                analysis_map[str(analysis.filepath)] = analysis
+                analysis_map[_path_key(analysis.filepath)] = analysis
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {}
-            
-            for fp in filepaths:
-                analysis = analysis_map.get(str(fp))
-                future = executor.submit(
-                    self.process_track,
-                    fp,
-                    output_dir,
-                    config,
-                    analysis
-                )
-                futures[future] = fp
-            
-            completed = 0
-            for future in as_completed(futures):
-                filepath = futures[future]
-                completed += 1
-                
-                try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    if progress_callback:
-                        progress_callback(
-                            completed, 
-                            total, 
-                            filepath.name,
-                            result.status
-                        )
-                        
-                except Exception as e:
-                    results.append(ProcessingResult(
-                        filename=filepath.name,
-                        input_path=filepath,
-                        output_path=None,
-                        original_key='unknown',
-                        target_key='unknown',
-                        processing_time_seconds=0,
-                        status='error',
-                        error=str(e)
-                    ))
-                    
-                    if progress_callback:
-                        progress_callback(completed, total, filepath.name, 'error')
+        # Engines stay in the workers; only the config dict is pickled
+        worker = partial(
+            _worker_process,
+            output_dir_str=str(output_dir),
+            config_dict=config.to_dict(),
+            settings=self._worker_settings()
+        )
         
-        return results
+        progress = None
+        if progress_callback:
+            progress = lambda done, total, fp, result: progress_callback(done, total, fp.name, result.status)
+        
+        return self._execute_batch(
+            worker,
+            filepaths,
+            [analysis_map.get(_path_key(fp)) for fp in filepaths],
+            failed=ProcessingResult.failed,
+            progress=progress
+        )
     
     # =========================================================================
     # UTILITIES
     # =========================================================================
     
+    def _execute_batch(
+        self,
+        worker: Callable,
+        filepaths: list[Path],
+        *iterables,
+        failed: Callable[[Path, str], object],
+        progress: Optional[Callable[[int, int, Path, object], None]] = None
+    ) -> list:
+        """
+        Shared driver for analyze_batch/process_batch.
+        
+        Collects worker results in input order, turning pool-level failures
+        into failed(filepath, message) results, and reports progress as
+        progress(completed, total, filepath, result).
+        """
+        results = []
+        total = len(filepaths)
+        for completed, (filepath, result) in enumerate(
+            self._map_batch(worker, filepaths, *iterables), start=1
+        ):
+            if isinstance(result, Exception):
+                result = failed(filepath, str(result))
+            results.append(result)
+            if progress:
+                progress(completed, total, filepath, result)
+        return results
+    
+    def _map_batch(self, worker: Callable, filepaths: list[Path], *iterables) -> Iterator[tuple]:
+        """
+        Run worker over a batch on the shared process pool.
+        
+        Uses executor.map with a small chunksize rather than one future per
+        file. Workers get str paths. Yields (filepath, result) in input
+        order; result is the exception instead if the pool failed, for that
+        file and every one after it.
+        """
+        total = len(filepaths)
+        if not total:
+            return
+        workers = self._pool_size()
+        # Up to 8 files per task, but keep ~4 tasks per worker for balance
+        chunksize = max(1, min(8, total // (4 * workers)))
+        
+        path_strs = [str(fp) for fp in filepaths]
+        try:
+            outputs = self._get_pool().map(worker, path_strs, *iterables, chunksize=chunksize)
+        except BrokenProcessPool:
+            # A worker died since the last batch; start over with a fresh pool
+            self._discard_pool()
+            outputs = self._get_pool().map(worker, path_strs, *iterables, chunksize=chunksize)
+        error = None
+        for filepath in filepaths:
+            if error is None:
+                try:
+                    result = next(outputs)
+                except Exception as e:
+                    error = e
+                    if isinstance(e, BrokenProcessPool):
+                        self._discard_pool()
+            yield filepath, result if error is None else error
+    
+    def _worker_settings(self) -> dict:
+        """Constructor kwargs that batch workers rebuild their VocalForge with."""
+        return {
+            'default_sr': self.default_sr,
+            'min_tag_duration_seconds': self.min_tag_duration_seconds
+        }
+    
+    def _pool_size(self) -> int:
+        """Worker process count: max_workers, bounded by the memory cap."""
+        return max(1, min(self.max_workers, _MAX_POOL_WORKERS))
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Spawn-context worker pool shared by every batch call."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._pool_size(),
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_warm_worker,
+                initargs=(self._worker_settings(),)
+            )
+            atexit.register(self._pool.shutdown, wait=False)
+        return self._pool
+    
+    def _discard_pool(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            atexit.unregister(pool.shutdown)
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def close(self) -> None:
+        """Shut down the batch worker pool (a new one starts on demand)."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            atexit.unregister(pool.shutdown)
+            pool.shutdown(wait=True)
+    
+    def __enter__(self) -> 'VocalForge':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
     def get_available_presets(self) -> list[dict]:
         """Get list of available artifact presets with their parameters."""
         presets = []
@@ -568,15 +840,8 @@ class VocalForge:
             return ('C', 'major')
         
         if strategy == 'most_common':
-            # Count key occurrences
-            key_counts = {}
-            for a in valid:
-                full_key = f"{a.key}_{a.mode}"
-                key_counts[full_key] = key_counts.get(full_key, 0) + 1
-            
-            # Get most common
-            most_common = max(key_counts, key=key_counts.get)
-            key, mode = most_common.split('_')
+            # Most frequent (key, mode); ties go to the first seen
+            (key, mode), _ = Counter((a.key, a.mode) for a in valid).most_common(1)[0]
             return (key, mode)
             
         else:  # highest_confidence
@@ -596,5 +861,11 @@ class VocalForge:
             'tracks': [a.to_dict() for a in analyses]
         }
         
+        if _HAS_ORJSON:
+            output_path.write_bytes(
+                orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            )
+            return
+        
         with open(output_path, 'w') as f:
             json.dump(report, f, indent=2)
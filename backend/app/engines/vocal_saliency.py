@@ -1,14 +1,54 @@
 import torch
 import numpy as np
 import scipy.ndimage
+import scipy.signal
 from pathlib import Path
 from typing import List, Dict
 from app.engines.torch_utils import load_audio
 from app.engines.torch_analysis import compute_rms, compute_spectral_flatness, compute_periodicity
 
+# Past this width, float64 prefix-sum differences start losing digits on
+# long curves; oaconvolve is still far cheaper than a direct convolution.
+_CUMSUM_MAX_WIDTH = 4096
+
+
+def _moving_average(x: np.ndarray, width: int) -> np.ndarray:
+    """
+    Uniform moving average, same output as np.convolve(..., mode='valid').
+    
+    Keeps the input's float dtype; the prefix sum itself is accumulated in
+    float64 so float32 curves don't drift over long files.
+    """
+    if width > _CUMSUM_MAX_WIDTH:
+        return scipy.signal.oaconvolve(x, np.full(width, 1.0 / width, dtype=x.dtype), mode='valid')
+    cs = np.concatenate(([0.0], np.cumsum(x, dtype=np.float64)))
+    return ((cs[width:] - cs[:-width]) / width).astype(x.dtype, copy=False)
+
+
+def _box_gauss(x: np.ndarray, sigma: float, passes: int = 3) -> np.ndarray:
+    """
+    Gaussian smoothing approximated by repeated box filters.
+    
+    Each pass is an O(N) moving average, so the cost doesn't grow with
+    sigma. Edges are mirrored like gaussian_filter1d's default 'reflect'.
+    """
+    width = int(round(np.sqrt(12 * sigma * sigma / passes + 1))) | 1  # odd, so centred
+    radius = width // 2
+    out = np.asarray(x, dtype=np.result_type(x, np.float32))
+    for _ in range(passes):
+        out = _moving_average(np.pad(out, radius, mode='symmetric'), width)
+    return out
+
+
 class VocalSaliency:
-    def __init__(self, sr=44100):
+    def __init__(self, sr=44100, smoothing='box'):
+        """
+        Args:
+            sr: Analysis sample rate
+            smoothing: 'box' (3-pass box approximation) or 'exact' (gaussian_filter1d)
+        """
         self.sr = sr
+        self.smoothing = smoothing
 
     def analyze_catchiness(self, audio_path: Path) -> List[Dict]:
         """
@@ -16,31 +56,27 @@ class VocalSaliency:
         Heuristic: High energy + High tonality (singing) + Stable pitch.
         GPU-Accelerated for M3 Max.
         """
-        # 1. Load to GPU
-        y_tensor = load_audio(str(audio_path), sr=self.sr)
+        # 1. Load to GPU (mixed to mono on-device)
+        y_tensor = load_audio(str(audio_path), sr=self.sr, mono=True)
         
-        # Convert to mono if stereo
-        if y_tensor.shape[0] > 1:
-            y_tensor = torch.mean(y_tensor, dim=0, keepdim=True)
-            
         # 2. Compute Features on GPU
         hop_length = 512
         
         # RMS Energy
         rms_tensor = compute_rms(y_tensor, hop_length=hop_length)
-        rms = rms_tensor.cpu().numpy()[0]
+        rms = rms_tensor.to(torch.float32).cpu().numpy()[0]
         
         # Spectral Flatness
         flatness_tensor = compute_spectral_flatness(y_tensor, hop_length=hop_length)
-        flatness = flatness_tensor.cpu().numpy()[0]
+        flatness = flatness_tensor.to(torch.float32).cpu().numpy()[0]
         tonality = 1.0 - flatness
         
         # Periodicity (Voicedness) - Replaces slow pYIN
         periodicity_tensor = compute_periodicity(y_tensor, hop_length=hop_length)
-        voiced_prob = periodicity_tensor.cpu().numpy()[0]
+        voiced_prob = periodicity_tensor.to(torch.float32).cpu().numpy()[0]
         
         # 3. Calculate Score
-        # Normalize metrics
+        # Normalize metrics (float32 throughout; every curve is in [0, 1])
         def normalize(x):
             return (x - np.min(x)) / (np.max(x) - np.min(x) + 1e-10)
             
@@ -53,7 +89,10 @@ class VocalSaliency:
         saliency_curve = (rms_norm * 0.3) + (tonality_norm * 0.5) + (voiced_norm * 0.2)
         
         # Smooth the curve
-        saliency_curve = scipy.ndimage.gaussian_filter1d(saliency_curve, sigma=20)
+        if self.smoothing == 'exact':
+            saliency_curve = scipy.ndimage.gaussian_filter1d(saliency_curve, sigma=20, output=np.float32)
+        else:
+            saliency_curve = _box_gauss(saliency_curve, sigma=20)
         
         # Find peaks/regions
         # We want 4-bar loops (approx 8s at 120bpm)
@@ -64,10 +103,8 @@ class VocalSaliency:
         
         # Sliding window
         if len(saliency_curve) > window_size_frames:
-            # Vectorized window averaging for speed
-            # Create a uniform kernel
-            kernel = np.ones(window_size_frames) / window_size_frames
-            windowed_scores = np.convolve(saliency_curve, kernel, mode='valid')
+            # O(N) rolling mean from a prefix sum (same as a 'valid' box convolve)
+            windowed_scores = _moving_average(saliency_curve, window_size_frames)
             
             # Find peaks in the windowed scores
             # Simple peak picking: find local maxima separated by window size
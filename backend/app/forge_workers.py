@@ -21,10 +21,8 @@ def analyze_track_task(path_str: str):
         
         # Load audio (limit to 180s for speed - enough for Key/BPM)
         from app.engines.torch_utils import load_audio
-        tensor = load_audio(path_str, sr=44100, duration=180)
-        y = tensor.cpu().numpy()
-        if y.ndim == 2:
-            y = y.mean(axis=0)
+        tensor = load_audio(path_str, sr=44100, duration=180, mono=True)
+        y = tensor.cpu().numpy()[0]
         sr = 44100
         
         # BPM
@@ -9,14 +9,15 @@ Clean architecture with:
 """
 
 from contextlib import asynccontextmanager
+import os
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
 from .core.database import init_db
 from .core.queue import get_queue, Worker
 from .core.storage import get_storage
+from .core.responses import RangedStaticFiles
 from .core import workers  # Import to register workers
 from .api import api_router
 
@@ -55,12 +56,16 @@ async def lifespan(app: FastAPI):
     # Start background queue
     await queue.start()
     
-    # Skip preloading - load on first request to avoid startup deadlocks
-    # from .model_manager import get_model_manager
-    # model_manager = get_model_manager()
-    # print("[STARTUP] Pre-loading Demucs model (background)...")
-    # model_manager.preload_critical_models()
-    print("[STARTUP] Model loading deferred to first request")
+    # Skip preloading by default - load on first request to avoid startup deadlocks.
+    # Set LOOPFORGE_PRELOAD_MODELS=1 to load Demucs in a background thread instead,
+    # so the first separation doesn't pay for it. (VocalForge batch workers have
+    # their own switch, LOOPFORGE_FORGE_PRELOAD_ENGINES.)
+    if os.environ.get("LOOPFORGE_PRELOAD_MODELS") == "1":
+        from .model_manager import get_model_manager
+        print("[STARTUP] Pre-loading Demucs model (background)...")
+        get_model_manager().preload_critical_models()
+    else:
+        print("[STARTUP] Model loading deferred to first request")
     
     print("[STARTUP] Ready!")
     
@@ -96,7 +101,7 @@ app.include_router(api_router)
 # Mount static files for audio streaming
 storage = get_storage()
 if storage.root.exists():
-    app.mount("/files", StaticFiles(directory=str(storage.root)), name="files")
+    app.mount("/files", RangedStaticFiles(directory=str(storage.root)), name="files")
 
 
 # Health check
@@ -52,14 +52,14 @@ class ForgeService:
     }
     
     KEY_ORDER = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
+    KEY_INDEX = {key: idx for idx, key in enumerate(KEY_ORDER)}
 
     @staticmethod
     def get_semitones(from_key: str, to_key: str) -> int:
         """Calculate semitone distance between keys."""
-        try:
-            from_idx = ForgeService.KEY_ORDER.index(from_key)
-            to_idx = ForgeService.KEY_ORDER.index(to_key)
-        except ValueError:
+        from_idx = ForgeService.KEY_INDEX.get(from_key)
+        to_idx = ForgeService.KEY_INDEX.get(to_key)
+        if from_idx is None or to_idx is None:
             return 0
             
         dist = to_idx - from_idx
@@ -67,6 +67,35 @@ class ForgeService:
         if dist < -6: dist += 12
         return dist
 
+    # Uncompressed containers soundfile can seek by frame (no decode needed)
+    PCM_SUFFIXES = {'.wav', '.aif', '.aiff'}
+
+    @staticmethod
+    def crop_audio(src_path: Path, dst_path: Path, start: float, duration: float) -> None:
+        """
+        Cut [start, start + duration) seconds of src_path into dst_path.
+        
+        PCM files are sliced in-process with soundfile (sample-accurate, same
+        subtype, no subprocess); everything else goes through ffmpeg stream copy.
+        """
+        if src_path.suffix.lower() in ForgeService.PCM_SUFFIXES:
+            import soundfile as sf
+            with sf.SoundFile(str(src_path)) as f:
+                # int32 round-trips any PCM subtype exactly
+                dtype = 'int32' if f.subtype.startswith('PCM') else 'float64'
+                f.seek(min(int(start * f.samplerate), f.frames))
+                # Like ffmpeg without -t: no duration means "to end of file"
+                frames = int(duration * f.samplerate) if duration else -1
+                data = f.read(frames, dtype=dtype, always_2d=True)
+                sf.write(str(dst_path), data, f.samplerate, subtype=f.subtype, format=f.format)
+            return
+        
+        cmd = ['ffmpeg', '-y', '-ss', str(start), '-i', str(src_path)]
+        if duration:
+            cmd.extend(['-t', str(duration)])
+        cmd.extend(['-acodec', 'copy', str(dst_path)])
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
     @staticmethod
     def generate_peaks(file_path: str) -> Optional[str]:
         """
@@ -334,14 +363,10 @@ class ForgeService:
                             if not cropped_path.exists():
                                 update_track_status(filename, "Cropping...", 5)
                                 
-                                cmd = ['ffmpeg', '-y', '-ss', str(start), '-i', str(filepath)]
-                                if duration:
-                                    cmd.extend(['-t', str(duration)])
-                                cmd.extend(['-acodec', 'copy', str(cropped_path)])
-                                
                                 await asyncio.get_event_loop().run_in_executor(
-                                    None, 
-                                    lambda: subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                                    None,
+                                    ForgeService.crop_audio,
+                                    filepath, cropped_path, start, duration
                                 )
                                 if cropped_path.exists():
                                     filepath = cropped_path
@@ -803,7 +828,8 @@ class ForgeService:
                     # Create zip in executor to avoid blocking event loop
                     def create_zip():
                         try:
-                            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+                            # Outputs are WAV stems: fast deflate, since higher levels gain ~nothing on PCM
+                            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
                                 for result in results:
                                     try:
                                         if not result or not isinstance(result, dict):
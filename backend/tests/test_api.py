@@ -160,3 +160,26 @@ class TestEventTypes:
         assert event.type == EventType.JOB_PROGRESS
         assert event.session_id == "session-123"
         assert event.data["progress"] == 50
+
+
+class TestRangeParsing:
+    """Tests for byte-range parsing used by audio file responses."""
+    
+    def test_single_ranges(self):
+        """Closed, open-ended and suffix ranges resolve to inclusive bounds."""
+        from app.core.responses import parse_range
+        
+        assert parse_range("bytes=0-99", 1000) == (0, 99)
+        assert parse_range("bytes=900-", 1000) == (900, 999)
+        assert parse_range("bytes=-10", 1000) == (990, 999)
+        assert parse_range("bytes=950-5000", 1000) == (950, 999)
+    
+    def test_ignored_and_unsatisfiable(self):
+        """Malformed/multi ranges are ignored; out-of-bounds ones raise."""
+        from app.core.responses import parse_range
+        
+        assert parse_range("bytes=0-1,5-6", 1000) is None
+        assert parse_range("bytes=9-3", 1000) is None
+        assert parse_range("items=0-1", 1000) is None
+        with pytest.raises(ValueError):
+            parse_range("bytes=1000-", 1000)
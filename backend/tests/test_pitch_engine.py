@@ -0,0 +1,19 @@
+"""
+Tests for PitchEngine scale snapping.
+"""
+
+import numpy as np
+
+from app.engines.pitch_engine import PitchEngine
+
+
+class TestScaleSnapping:
+    """Tests for the vectorized scale snap used by correct_pitch."""
+
+    def test_vectorized_snap_matches_scalar(self):
+        """Array snap should give the same cents as _snap_to_scale per frame."""
+        engine = PitchEngine()
+        freqs = np.random.default_rng(0).uniform(60.0, 2100.0, 2000)
+        for scale in ((0, 2, 4, 5, 7, 9, 11), (9, 11, 0, 2, 4, 5, 7), (1,)):
+            expected = [engine._snap_to_scale(f, scale)[1] for f in freqs]
+            np.testing.assert_allclose(engine._snap_to_scale_cents(freqs, scale), expected, atol=1e-9)
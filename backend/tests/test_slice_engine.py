@@ -0,0 +1,50 @@
+"""
+Tests for SliceBank weighted selection.
+"""
+
+import random
+
+from app.engines.slice_engine import SliceBank, Slice, SliceRole
+
+
+def make_bank(energies):
+    slices = [
+        Slice(index=i, start_sample=0, end_sample=1, start_time=0.0, end_time=0.1, duration=0.1, rms_energy=e)
+        for i, e in enumerate(energies)
+    ]
+    return SliceBank(id='bank', source_path='x.wav', source_filename='x.wav', role=SliceRole.DRUMS, slices=slices)
+
+
+class TestGetRandomWeighted:
+    """Tests for cached weighted slice selection."""
+
+    def test_matches_linear_cumsum_scan(self):
+        """Seeded picks should match a first-cumsum->=r scan over normalized weights."""
+        energies = [0.1, 0.5, 0.0, 0.9, 0.3]
+        bank = make_bank(energies)
+        total = sum(energies) + 1e-8
+
+        def scan(r):
+            cumsum = 0.0
+            for i, e in enumerate(energies):
+                cumsum += e / total
+                if r <= cumsum:
+                    return i
+            return len(energies) - 1
+
+        rolls = random.Random(3)
+        expected = [scan(r) for r in [rolls.random() for _ in range(500)]]
+
+        rng = random.Random(3)
+        picks = [bank.get_random_weighted('energy', rng=rng).index for _ in range(500)]
+
+        assert picks == expected
+
+    def test_weights_rebuild_when_slices_change(self):
+        """Appending a slice should invalidate the cached weights."""
+        bank = make_bank([1.0, 1.0])
+        assert bank.cumulative_weights('energy').size == 2
+
+        bank.slices.append(Slice(index=2, start_sample=0, end_sample=1, start_time=0.0, end_time=0.1, duration=0.1, rms_energy=1.0))
+
+        assert bank.cumulative_weights('energy').size == 3
@@ -0,0 +1,347 @@
+"""
+Tests for the trigger engine (generative sequencing).
+"""
+
+import numpy as np
+import pytest
+
+from app.engines.trigger_engine import (
+    TriggerEngine, TriggerMode, GridTriggerSource, EuclideanTriggerSource,
+    ProbabilityTriggerSource, TriggerEvent, TriggerRule,
+)
+
+
+class TestProbabilityTriggerSource:
+    """Tests for probability-based triggering."""
+
+    def test_certain_steps_always_fire(self):
+        """Probability 1.0 on every step should produce a full grid."""
+        source = ProbabilityTriggerSource(steps=4, probabilities=[1.0] * 4, subdivision=4.0)
+
+        times = source.get_trigger_times(duration_beats=2.0, bpm=120)
+
+        assert times == [i / 4.0 for i in range(8)]
+
+    def test_zero_probability_steps_never_fire(self):
+        """Steps with probability 0 should never appear."""
+        source = ProbabilityTriggerSource(steps=2, probabilities=[1.0, 0.0], subdivision=2.0)
+
+        times = source.get_trigger_times(duration_beats=4.0, bpm=120)
+
+        assert times == [0.0, 1.0, 2.0, 3.0]
+
+    def test_engine_seed_is_reproducible(self):
+        """Same engine seed should yield the same probabilistic sequence."""
+        def run(seed):
+            source = ProbabilityTriggerSource(steps=16, probabilities=[0.5] * 16, subdivision=4.0)
+            engine = TriggerEngine(mode=TriggerMode.RANDOM, trigger_source=source, seed=seed)
+            events = engine.generate_sequence(num_slices=8, duration_beats=16.0, bpm=120)
+            return [(e.time, e.slice_index) for e in events]
+
+        assert run(42) == run(42)
+        assert run(42) != run(7)
+
+    def test_source_draws_do_not_shift_engine_rolls(self):
+        """A stochastic source draws from its own stream, leaving CHAOS rolls untouched."""
+        def run(source):
+            engine = TriggerEngine(mode=TriggerMode.CHAOS, trigger_source=source, seed=11)
+            return [e.slice_index for e in engine.generate_sequence(8, 8.0, 120)]
+
+        always = ProbabilityTriggerSource(steps=4, probabilities=[1.0] * 4, subdivision=4.0)
+
+        assert run(always) == run(GridTriggerSource(subdivision=4.0))
+
+
+class TestBatchGeneration:
+    """Tests for batched multi-seed sequence generation."""
+
+    def test_batch_lanes_match_single_renders(self):
+        """Each lane should equal a single-shot render with the same seed."""
+        engine = TriggerEngine(mode=TriggerMode.RANDOM, trigger_source=GridTriggerSource(subdivision=4.0))
+
+        batch = engine.generate_sequences_batch([1, 2, 3], num_slices=8, duration_beats=4.0, bpm=120)
+
+        assert batch['slice_indices'].shape == (3, 16)
+        for lane, seed in enumerate([1, 2, 3]):
+            single = TriggerEngine(
+                mode=TriggerMode.RANDOM,
+                trigger_source=GridTriggerSource(subdivision=4.0),
+                seed=seed,
+            ).generate_sequence(num_slices=8, duration_beats=4.0, bpm=120)
+            assert batch['lengths'][lane] == len(single)
+            assert batch['slice_indices'][lane].tolist() == [e.slice_index for e in single]
+
+
+class TestEuclideanTriggerSource:
+    """Tests for Euclidean rhythm generation."""
+
+    def test_tresillo(self):
+        """E(3, 8) should be the tresillo."""
+        source = EuclideanTriggerSource(hits=3, steps=8)
+
+        assert source.get_trigger_times(8.0, 120) == [0.0, 3.0, 6.0]
+
+    def test_large_patterns_do_not_recurse(self):
+        """Very long patterns should build without hitting the recursion limit."""
+        source = EuclideanTriggerSource(hits=1597, steps=4181)
+
+        assert sum(source._pattern) == 1597
+
+    def test_jit_builder_matches_pure_python(self):
+        """Long patterns built by the JIT path should equal the pure-Python build."""
+        from app.engines import trigger_engine
+
+        if not trigger_engine._HAS_NUMBA:
+            pytest.skip("numba not installed")
+
+        pattern = trigger_engine._bjorklund_pattern
+        jit = [pattern.__wrapped__(hits, 512, 5) for hits in (1, 127, 256, 300, 511)]
+        try:
+            trigger_engine._HAS_NUMBA = False
+            pure = [pattern.__wrapped__(hits, 512, 5) for hits in (1, 127, 256, 300, 511)]
+        finally:
+            trigger_engine._HAS_NUMBA = True
+
+        assert jit == pure
+
+
+class TestTriggerTimesArray:
+    """Tests for the array-valued trigger time API."""
+
+    def test_array_matches_list_for_every_source(self):
+        """get_trigger_times_array should agree with get_trigger_times."""
+        from app.engines.trigger_engine import TRIGGER_PRESETS
+
+        for preset in TRIGGER_PRESETS.values():
+            source = preset['trigger_source_factory']()
+            if source.stochastic:
+                continue
+            times = source.get_trigger_times_array(8.0, 120)
+            assert times.dtype == np.float64
+            assert times.tolist() == source.get_trigger_times(8.0, 120)
+
+    def test_velocities_match_scalar_lookup(self):
+        """get_velocities should agree with per-time get_velocity for every preset source."""
+        from app.engines.trigger_engine import TRIGGER_PRESETS
+
+        for preset in TRIGGER_PRESETS.values():
+            source = preset['trigger_source_factory']()
+            times = source.get_trigger_times_array(8.0, 120)
+            assert source.get_velocities(times).tolist() == [source.get_velocity(t) for t in times]
+
+    def test_cached_array_is_read_only(self):
+        """Cached arrays are shared between callers and must not be writable."""
+        times = GridTriggerSource(subdivision=2.0).get_trigger_times_array_cached(4.0, 120)
+
+        with pytest.raises(ValueError):
+            times[0] = 1.0
+
+    def test_sequence_arrays_match_events(self):
+        """generate_sequence_arrays should mirror generate_sequence field by field."""
+        def engine():
+            return TriggerEngine(mode=TriggerMode.RANDOM, trigger_source=GridTriggerSource(4.0), seed=3)
+
+        events = engine().generate_sequence(8, 4.0, 120)
+        arrays = engine().generate_sequence_arrays(8, 4.0, 120)
+
+        assert arrays['times'].tolist() == [e.time for e in events]
+        assert arrays['slice_indices'].tolist() == [e.slice_index for e in events]
+
+    def test_sequence_arrays_with_rules_match_events(self):
+        """Rule-driven sequences should fall back to converting the events."""
+        rules = [TriggerRule(id='skip', name='Skip', condition='total_plays % 2', action='skip_next')]
+
+        def engine():
+            return TriggerEngine(mode=TriggerMode.SEQUENTIAL, trigger_source=GridTriggerSource(1.0), rules=rules)
+
+        events = engine().generate_sequence(4, 6.0, 120)
+        arrays = engine().generate_sequence_arrays(4, 6.0, 120)
+
+        assert arrays['times'].tolist() == [e.time for e in events]
+        assert arrays['slice_indices'].dtype == np.int32
+
+
+class TestTriggerTimesCache:
+    """Tests for memoized trigger times."""
+
+    def test_equal_sources_share_cached_times(self):
+        """Sources with identical parameters should return identical cached times."""
+        a = EuclideanTriggerSource(hits=5, steps=8)
+        b = EuclideanTriggerSource(hits=5, steps=8)
+
+        assert a.get_trigger_times_cached(8.0, 120) == a.get_trigger_times(8.0, 120)
+        assert b.get_trigger_times_cached(8.0, 120) == a.get_trigger_times_cached(8.0, 120)
+
+    def test_parameter_change_invalidates(self):
+        """Mutating a source parameter should change the cache key."""
+        source = GridTriggerSource(subdivision=1.0)
+        assert len(source.get_trigger_times_cached(4.0, 120)) == 4
+
+        source.subdivision = 2.0
+        assert len(source.get_trigger_times_cached(4.0, 120)) == 8
+
+    def test_tempo_independent_sources_share_entry_across_bpm(self):
+        """Beat-domain sources should reuse one cache entry at any tempo."""
+        source = EuclideanTriggerSource(hits=3, steps=8)
+
+        assert source.get_trigger_times_array_cached(8.0, 120) is source.get_trigger_times_array_cached(8.0, 160)
+
+
+class TestRules:
+    """Tests for rule evaluation in generate_sequence."""
+
+    def test_skip_next_drops_following_trigger(self):
+        """A skip_next rule should drop the trigger after the one that fired it."""
+        rule = TriggerRule(id='skip', name='Skip', condition='total_plays % 2', action='skip_next')
+        engine = TriggerEngine(
+            mode=TriggerMode.SEQUENTIAL,
+            trigger_source=GridTriggerSource(subdivision=1.0),
+            rules=[rule],
+            seed=1,
+        )
+
+        events = engine.generate_sequence(num_slices=4, duration_beats=6.0, bpm=120)
+
+        # Plays 2 and 4 (beats 1 and 4) fire the rule, so beats 2 and 5 are skipped
+        assert [e.time for e in events] == [0.0, 1.0, 3.0, 4.0]
+        assert [e.slice_index for e in events] == [0, 1, 2, 3]
+
+    def test_condition_and_action_helpers_use_compiled_forms(self):
+        """The string-based helpers should agree with the compiled rules."""
+        engine = TriggerEngine(seed=1)
+        engine.state.total_plays = 6
+        event = TriggerEvent(time=0.0, slice_index=0)
+
+        assert engine._evaluate_condition('total_plays % 3')
+        assert not engine._evaluate_condition('total_plays % 0')
+        assert engine._apply_action('pitch_down_5', event, 4) == (event, False)
+        assert event.pitch_shift == -5 and event.rule_modified
+
+    def test_jit_rule_loop_matches_python_loop(self):
+        """Long ordered-mode sequences with rules should match the Python loop exactly."""
+        from app.engines import trigger_engine
+
+        if not trigger_engine._HAS_NUMBA:
+            pytest.skip("numba not installed")
+
+        rules = [
+            TriggerRule(id='a', name='a', condition='consecutive_plays >= 1', action='skip_next', probability=0.3),
+            TriggerRule(id='b', name='b', condition='total_plays % 3', action='pitch_up_2', probability=0.8),
+            TriggerRule(id='c', name='c', condition='slice_index != 2', action='half_velocity', probability=0.5),
+            TriggerRule(id='d', name='d', condition='total_plays > 40', action='reset_sequence', probability=0.1),
+        ]
+
+        def run(jit):
+            engine = TriggerEngine(
+                mode=TriggerMode.SEQUENTIAL, trigger_source=GridTriggerSource(4.0), rules=rules, seed=12,
+            )
+            if not jit:
+                engine._can_run_rules_jit = lambda *args: False
+            return engine.generate_sequence(num_slices=5, duration_beats=128.0, bpm=120), engine.state
+
+        assert run(True) == run(False)
+
+    def test_seeded_rules_ignore_global_random(self):
+        """Rule probability rolls should come from the engine seed, not the random module."""
+        import random
+
+        def run(legacy_rng):
+            rules = [TriggerRule(id='rev', name='Reverse', condition='total_plays > 0', action='reverse', probability=0.5)]
+            engine = TriggerEngine(
+                mode=TriggerMode.CHAOS, trigger_source=GridTriggerSource(4.0), rules=rules, seed=9, legacy_rng=legacy_rng,
+            )
+            random.random()
+            return [(e.slice_index, e.reverse) for e in engine.generate_sequence(8, 8.0, 120)]
+
+        assert run(False) == run(False)
+        assert run(True) == run(True)
+
+
+class TestTriggerEvent:
+    """Tests for TriggerEvent serialization."""
+
+    def test_to_dict_round_trips_every_field(self):
+        """to_dict should cover every dataclass field and round-trip through from_dict."""
+        from dataclasses import fields
+
+        event = TriggerEvent(time=1.5, slice_index=3, velocity=0.8, pitch_shift=2, reverse=True)
+        data = event.to_dict()
+
+        assert list(data) == [f.name for f in fields(TriggerEvent)]
+        assert TriggerEvent.from_dict(data) == event
+
+
+class TestSelection:
+    """Tests for mode-based slice selection."""
+
+    def test_changing_mode_rebinds_selector(self):
+        """Assigning engine.mode should switch the selector used for new sequences."""
+        engine = TriggerEngine(mode=TriggerMode.RANDOM, trigger_source=GridTriggerSource(1.0), seed=4)
+
+        engine.mode = TriggerMode.SEQUENTIAL
+        events = engine.generate_sequence(num_slices=3, duration_beats=6.0, bpm=120)
+
+        assert [e.slice_index for e in events] == [0, 1, 2, 0, 1, 2]
+        assert all(e.triggered_by == 'sequential' for e in events)
+
+    def test_play_history_keeps_last_sixteen(self):
+        """play_history should hold only the most recent 16 slice indices."""
+        engine = TriggerEngine(mode=TriggerMode.SEQUENTIAL, trigger_source=GridTriggerSource(1.0))
+
+        engine.generate_sequence(num_slices=32, duration_beats=20.0, bpm=120)
+
+        assert list(engine.state.play_history) == list(range(4, 20))
+
+    def test_batched_selection_leaves_loop_state(self):
+        """The rule-free fast path should end in the same state as the per-event loop."""
+        def run(batched):
+            engine = TriggerEngine(mode=TriggerMode.SEQUENTIAL, trigger_source=EuclideanTriggerSource(5, 8))
+            if not batched:
+                engine._can_select_batched = lambda: False
+            events = engine.generate_sequence(num_slices=3, duration_beats=8.0, bpm=120)
+            return events, engine.state
+
+        assert run(True) == run(False)
+
+    def test_batched_chaos_continuations_step_by_one(self):
+        """Rule-free CHAOS should be reproducible and mix fresh picks with +1 runs."""
+        def run():
+            engine = TriggerEngine(mode=TriggerMode.CHAOS, trigger_source=GridTriggerSource(4.0), seed=8)
+            return [e.slice_index for e in engine.generate_sequence(num_slices=16, duration_beats=64.0, bpm=120)]
+
+        indices = run()
+        steps = sum(b == (a + 1) % 16 for a, b in zip(indices, indices[1:]))
+
+        assert indices == run()
+        assert 0.25 < steps / (len(indices) - 1) < 0.45
+
+    def test_batched_random_selection_stays_in_range(self):
+        """Batched RANDOM picks should cover valid slice indices only."""
+        engine = TriggerEngine(mode=TriggerMode.RANDOM, trigger_source=GridTriggerSource(4.0), seed=5)
+
+        indices = [e.slice_index for e in engine.generate_sequence(num_slices=6, duration_beats=64.0, bpm=120)]
+
+        assert set(indices) == set(range(6))
+
+
+class TestPresets:
+    """Tests for preset construction."""
+
+    def test_engines_do_not_share_sources_or_rules(self):
+        """Each preset engine should get its own trigger source and rule objects."""
+        from app.engines.trigger_engine import create_trigger_engine
+
+        a = create_trigger_engine('autechre_glitch', seed=1)
+        b = create_trigger_engine('autechre_glitch', seed=1)
+
+        assert a.trigger_source is not b.trigger_source
+        assert a.rules[0] is not b.rules[0]
+        assert [e.to_dict() for e in a.generate_sequence(8, 8.0, 120)] == \
+            [e.to_dict() for e in b.generate_sequence(8, 8.0, 120)]
+
+    def test_source_class_matches_factory(self):
+        """trigger_source_class must name exactly what the factory builds."""
+        from app.engines.trigger_engine import TRIGGER_PRESETS
+
+        for preset in TRIGGER_PRESETS.values():
+            assert type(preset['trigger_source_factory']()) is preset['trigger_source_class']
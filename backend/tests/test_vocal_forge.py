@@ -0,0 +1,25 @@
+"""
+Tests for VocalForge track analysis.
+"""
+
+from unittest.mock import patch
+
+from app.engines.vocal_forge import VocalForge
+
+
+class TestAnalyzeTrack:
+    """Tests for the per-track analysis path."""
+
+    def test_short_clip_never_builds_tagger(self, sample_audio_path):
+        """Clips under min_tag_duration_seconds must not load CLAP at all."""
+        forge = VocalForge(min_tag_duration_seconds=4.0)
+
+        with patch(
+            "app.engines.vocal_forge.TaggingEngine",
+            side_effect=AssertionError("TaggingEngine built for a short clip"),
+        ) as tagging_engine:
+            analysis = forge.analyze_track(sample_audio_path)
+
+        assert analysis.status == 'analyzed', analysis.error
+        assert analysis.tags == []
+        tagging_engine.assert_not_called()
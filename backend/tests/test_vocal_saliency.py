@@ -0,0 +1,27 @@
+"""
+Tests for the VocalSaliency smoothing helpers.
+"""
+
+import numpy as np
+import scipy.ndimage
+
+from app.engines.vocal_saliency import _box_gauss, _moving_average
+
+
+class TestSmoothing:
+    """Tests for the O(N) window and Gaussian approximations."""
+
+    def test_moving_average_matches_convolve(self):
+        """Prefix-sum mean should match a 'valid' box convolution."""
+        x = np.random.default_rng(0).random(5000)
+        for width in (1, 689, 5000):
+            expected = np.convolve(x, np.ones(width) / width, mode='valid')
+            np.testing.assert_allclose(_moving_average(x, width), expected, atol=1e-10)
+
+    def test_box_gauss_approximates_gaussian(self):
+        """3-pass box filter should stay close to gaussian_filter1d."""
+        x = np.random.default_rng(0).random(20000)
+        approx = _box_gauss(x, sigma=20)
+        exact = scipy.ndimage.gaussian_filter1d(x, sigma=20)
+        assert approx.shape == exact.shape
+        assert np.sqrt(np.mean((approx - exact) ** 2)) < 0.01
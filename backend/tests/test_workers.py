@@ -67,9 +67,11 @@ class TestSeparationWorker:
 class TestAnalysisWorker:
     """Tests for the analysis worker."""
     
+    @patch("app.core.workers.get_storage")
     @patch("app.core.workers.get_db")
-    def test_analysis_extracts_metadata(self, mock_get_db, sample_audio_path):
+    def test_analysis_extracts_metadata(self, mock_get_db, mock_get_storage, sample_audio_path, temp_dir):
         """Analysis should extract BPM, key, and duration."""
+        from app.core.storage import Storage
         from app.core.workers import process_analysis
         
         mock_session = MagicMock()
@@ -77,10 +79,12 @@ class TestAnalysisWorker:
         mock_db.session.return_value.__enter__ = MagicMock(return_value=mock_session)
         mock_db.session.return_value.__exit__ = MagicMock(return_value=False)
         mock_get_db.return_value = mock_db
+        mock_get_storage.return_value = Storage(root=temp_dir / "storage")
         
         job = MagicMock()
         job.input_path = str(sample_audio_path)
         job.session_id = "test-session"
+        job.config = {}
         
         progress_calls = []
         result = process_analysis(job, lambda p, m: progress_calls.append((p, m)))
@@ -93,6 +97,62 @@ class TestAnalysisWorker:
         
         # Progress should complete
         assert progress_calls[-1][0] == 100
+    
+    @patch("app.core.workers.get_storage")
+    @patch("app.core.workers.get_db")
+    def test_analysis_reuses_cached_result(self, mock_get_db, mock_get_storage, sample_audio_path, temp_dir):
+        """Re-analyzing the same content should come from the hash cache."""
+        from app.core.storage import Storage
+        from app.core.workers import process_analysis
+        
+        mock_db = MagicMock()
+        mock_db.session.return_value.__enter__ = MagicMock(return_value=MagicMock())
+        mock_db.session.return_value.__exit__ = MagicMock(return_value=False)
+        mock_get_db.return_value = mock_db
+        mock_get_storage.return_value = Storage(root=temp_dir / "storage")
+        
+        job = MagicMock()
+        job.input_path = str(sample_audio_path)
+        job.session_id = "test-session"
+        job.config = {"content_hash": "ab" * 32}
+        
+        analyzed = {"bpm": 120.0, "key": "A minor", "duration": 1.0}
+        with patch("app.core.workers._analyze_bpm_key", return_value=analyzed):
+            first = process_analysis(job, lambda p, m: None)
+        
+        with patch("app.core.workers._analyze_bpm_key", side_effect=AssertionError("cache miss")):
+            second = process_analysis(job, lambda p, m: None)
+        
+        assert first == second == analyzed
+        assert not list((temp_dir / "storage" / "cache").rglob("*.tmp"))
+    
+    @patch("app.core.workers.get_storage")
+    @patch("app.core.workers.get_db")
+    def test_failed_analysis_is_not_cached(self, mock_get_db, mock_get_storage, sample_audio_path, temp_dir):
+        """A bpm=None / key="Unknown" fallback must be recomputed next time."""
+        from app.core.storage import Storage
+        from app.core.workers import process_analysis
+        
+        mock_db = MagicMock()
+        mock_db.session.return_value.__enter__ = MagicMock(return_value=MagicMock())
+        mock_db.session.return_value.__exit__ = MagicMock(return_value=False)
+        mock_get_db.return_value = mock_db
+        mock_get_storage.return_value = Storage(root=temp_dir / "storage")
+        
+        job = MagicMock()
+        job.input_path = str(sample_audio_path)
+        job.session_id = "test-session"
+        job.config = {"content_hash": "cd" * 32}
+        
+        failed = {"bpm": None, "key": "Unknown", "duration": 1.0}
+        analyzed = {"bpm": 120.0, "key": "A minor", "duration": 1.0}
+        with patch("app.core.workers._analyze_bpm_key", return_value=failed):
+            process_analysis(job, lambda p, m: None)
+        with patch("app.core.workers._analyze_bpm_key", return_value=analyzed) as analyze:
+            result = process_analysis(job, lambda p, m: None)
+        
+        analyze.assert_called_once()
+        assert result == analyzed
 
 
 class TestMomentsWorker: